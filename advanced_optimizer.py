@@ -1,19 +1,106 @@
 """
 Advanced NHL Fantasy Lineup Optimizer
-Uses non-linear optimization with GameScore projections and regression analysis.
+Uses integer programming with GameScore projections and regression analysis.
 """
 
+import hashlib
 import numpy as np
-from scipy.optimize import minimize
-from typing import Dict, List, Tuple, Optional
+from scipy import sparse
+from scipy.optimize import minimize, linprog, LinearConstraint, Bounds
+from typing import Dict, List, Tuple, Optional, Union
 import pandas as pd
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import StandardScaler
+
+try:
+    from scipy.optimize import milp
+except ImportError:  # SciPy < 1.9
+    milp = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, run the kernels as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def _net_points_objective(x, price, proj, base_budget, penalty_rate):
+    """Negative net fantasy points of a (relaxed) selection vector."""
+    total_price = 0.0
+    total_fp = 0.0
+    for i in range(x.shape[0]):
+        total_price += x[i] * price[i]
+        total_fp += x[i] * proj[i]
+    penalty = max(0.0, total_price - base_budget) * penalty_rate
+    return -(total_fp * (1.0 - penalty))
+
+
+@njit(cache=True, fastmath=True)
+def _net_points_gradient(x, price, proj, base_budget, penalty_rate):
+    """Analytic gradient of _net_points_objective with respect to x."""
+    total_price = 0.0
+    total_fp = 0.0
+    for i in range(x.shape[0]):
+        total_price += x[i] * price[i]
+        total_fp += x[i] * proj[i]
+    penalty = max(0.0, total_price - base_budget) * penalty_rate
+    grad = -proj * (1.0 - penalty)
+    if total_price > base_budget:
+        grad += total_fp * penalty_rate * price
+    return grad
+
+
+@njit(cache=True)
+def _swap_search(selected, price_cents, proj, pos_code, base_cents, max_cents, penalty_rate):
+    """
+    Improve a feasible selection with same-position one-in/one-out swaps.
+    
+    Each pass applies the swap with the largest gain in net points that keeps the
+    lineup within max_cents, stopping once no swap improves the lineup. Prices
+    and budgets are integer cents, so the budget tests are exact; penalty_rate
+    is per cent of overage.
+    """
+    n = selected.shape[0]
+    total_price = 0
+    total_fp = 0.0
+    for i in range(n):
+        if selected[i]:
+            total_price += price_cents[i]
+            total_fp += proj[i]
+    
+    while True:
+        current = total_fp * (1.0 - max(0, total_price - base_cents) * penalty_rate)
+        best_delta = 1e-9
+        best_out = -1
+        best_in = -1
+        for i in range(n):
+            if not selected[i]:
+                continue
+            for j in range(n):
+                if selected[j] or pos_code[j] != pos_code[i]:
+                    continue
+                new_price = total_price - price_cents[i] + price_cents[j]
+                if new_price > max_cents:
+                    continue
+                new_fp = total_fp - proj[i] + proj[j]
+                delta = new_fp * (1.0 - max(0, new_price - base_cents) * penalty_rate) - current
+                if delta > best_delta:
+                    best_delta = delta
+                    best_out = i
+                    best_in = j
+        if best_out < 0:
+            break
+        selected[best_out] = False
+        selected[best_in] = True
+        total_price += price_cents[best_in] - price_cents[best_out]
+        total_fp += proj[best_in] - proj[best_out]
+    return selected
 
 
 class AdvancedLineupOptimizer:
     """
-    Advanced optimizer using GameScore projections and non-linear optimization.
+    Advanced optimizer using GameScore projections and integer programming.
     """
     
     def __init__(self, base_budget: float = 100.0, max_budget: float = 120.0):
@@ -35,6 +122,10 @@ class AdvancedLineupOptimizer:
             'F': 6
         }
         self.total_players = sum(self.position_requirements.values())
+        
+        # Digest of the last regression input and its fitted (coef, intercept, r2)
+        self._last_reg_key = None
+        self._last_reg = None
     
     def prepare_player_dataframe(self, players: List[Dict]) -> pd.DataFrame:
         """
@@ -46,42 +137,31 @@ class AdvancedLineupOptimizer:
         Returns:
             DataFrame with calculated metrics
         """
-        from scoring import FantasyScorer
+        from scoring import FantasyScorer, POSITION_MAP
         
         scorer = FantasyScorer()
         
-        # Extract relevant data
-        data = []
-        for player in players:
-            # Skip players without price
-            price = player.get('cena', 0)
-            if price <= 0:
-                continue
-            
-            # Calculate metrics
-            gs_per_game = scorer.calculate_game_score(player)
-            fp_per_game = scorer.calculate_fantasy_points_per_game(player)
-            
-            # Get stats for additional context
-            stats = scorer._extract_stats(player)
-            games = scorer._get_stat(stats, 'games', 'gamesPlayed', 'games_played')
-            
-            if games == 0:
-                continue
-            
-            data.append({
-                'name': player.get('name', 'Unknown'),
-                'position': scorer._normalize_position(player.get('position', 'F')),
-                'team': player.get('team', '???'),
-                'price': price,
-                'games': games,
-                'gs_per_game': gs_per_game,
-                'fp_per_game': fp_per_game,
-                'total_gs': gs_per_game * games,
-                'total_fp': fp_per_game * games
-            })
+        # Skip players without price
+        priced = [p for p in players if p.get('cena', 0) > 0]
+        
+        if not priced:
+            return pd.DataFrame()
         
-        df = pd.DataFrame(data)
+        # Season weighting works on nested API data, so it stays per player;
+        # everything after it is computed on whole columns
+        stats = pd.DataFrame([scorer._extract_combined_stats(p) for p in priced])
+        
+        df = pd.DataFrame({
+            'name': [p.get('name', 'Unknown') for p in priced],
+            'position': (
+                pd.Series([p.get('position', 'F') for p in priced], dtype=object)
+                .str.upper().str.strip().map(POSITION_MAP).fillna('F')
+            ),
+            'team': [p.get('team', '???') for p in priced],
+            'price': [p['cena'] for p in priced]
+        })
+        df = df.join(scorer.calculate_batch(stats, df['position']))
+        df = df[df['games'] != 0].reset_index(drop=True)
         
         if len(df) == 0:
             return df
@@ -95,103 +175,170 @@ class AdvancedLineupOptimizer:
         """
         Use regression to project fantasy points from GameScore.
         
+        The projection, season total and value per cost are computed in one NumPy
+        pass. The resulting arrays are kept in self._arrays for the solvers and
+        copied into the DataFrame only for reporting.
+        
         Args:
-            df: DataFrame with gs_per_game and fp_per_game
+            df: DataFrame with price, games, gs_per_game and fp_per_game
             
         Returns:
-            DataFrame with projected_fp_per_game column added
+            DataFrame with projected_fp_per_game, projected_season_fp and
+            value_per_cost columns added
         """
+        gs = df['gs_per_game'].to_numpy(dtype=float)
+        fp = df['fp_per_game'].to_numpy(dtype=float)
+        price = df['price'].to_numpy(dtype=float)
+        
         # Filter out players with insufficient data
-        valid_data = df[(df['gs_per_game'] > 0) & (df['fp_per_game'] > 0)].copy()
+        valid = (gs > 0) & (fp > 0)
         
-        if len(valid_data) < 10:
+        if valid.sum() < 10:
             # Not enough data for regression, use simple ratio
             print("⚠️  Insufficient data for regression, using simple ratio method")
-            total_fp = df['total_fp'].sum()
-            total_gs = df['total_gs'].sum()
+            games = df['games'].to_numpy(dtype=float)
+            total_gs = gs @ games
             
             if total_gs > 0:
-                fp_per_gs_ratio = total_fp / total_gs
-                df['projected_fp_per_game'] = df['gs_per_game'] * fp_per_gs_ratio
+                proj_per_game = gs * ((fp @ games) / total_gs)
             else:
-                df['projected_fp_per_game'] = df['fp_per_game']
-            
-            return df
-        
-        # Prepare data for regression
-        X = valid_data[['gs_per_game']].values
-        y = valid_data['fp_per_game'].values
+                proj_per_game = fp
+        else:
+            coef, intercept = self._fit_projection(gs[valid], fp[valid])
+            proj_per_game = coef * gs + intercept
+        
+        # Non-negative projections, season total (82 games) and value per cost
+        proj_per_game = np.clip(proj_per_game, 0, None)
+        proj_season = proj_per_game * 82.0
+        value_per_cost = proj_season / price
+        
+        # Positions as small integer codes in position_requirements order (G, D, F)
+        positions = df['position'].to_numpy()
+        pos_code = np.full(len(positions), -1, dtype=np.int8)
+        for code, pos in enumerate(self.position_requirements):
+            pos_code[positions == pos] = code
+        
+        self._arrays = {
+            'names': df['name'].to_numpy(),
+            'positions': positions,
+            'pos_code': pos_code,
+            'price': price,
+            # Prices have 2-decimal resolution, so integer cents are exact
+            'price_cents': np.rint(price * 100).astype(np.int32),
+            'proj': proj_season,
+            'value_per_cost': value_per_cost
+        }
         
-        # Fit linear regression
-        model = LinearRegression()
-        model.fit(X, y)
+        df['projected_fp_per_game'] = proj_per_game
+        df['projected_season_fp'] = proj_season
+        df['value_per_cost'] = value_per_cost
         
-        # Calculate R² score
-        r2_score = model.score(X, y)
-        print(f"✓ Regression model R² score: {r2_score:.3f}")
-        print(f"  Coefficient: {model.coef_[0]:.3f}, Intercept: {model.intercept_:.3f}")
+        return df
+    
+    def _fit_projection(self, gx: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+        """
+        Closed-form OLS fit of fp_per_game on gs_per_game.
         
-        # Predict for all players
-        df['projected_fp_per_game'] = model.predict(df[['gs_per_game']])
+        Args:
+            gx: GameScore per game of players with usable data
+            y: Fantasy points per game of the same players
+            
+        Returns:
+            Tuple of (coefficient, intercept)
+        """
+        # Digest of the exact inputs, so only an identical player set reuses a fit
+        cache_key = hashlib.blake2b(
+            np.ascontiguousarray(gx).tobytes() + np.ascontiguousarray(y).tobytes(),
+            digest_size=16
+        ).digest()
+        
+        if cache_key == self._last_reg_key:
+            coef, intercept, r2_score = self._last_reg
+        else:
+            mx = gx.mean()
+            my = y.mean()
+            dx = gx - mx
+            dy = y - my
+            coef = (dx * dy).sum() / (dx * dx).sum()
+            intercept = my - coef * mx
+            ss_tot = (dy * dy).sum()
+            r2_score = 1.0 - ((y - coef * gx - intercept) ** 2).sum() / ss_tot if ss_tot > 0 else 1.0
+            self._last_reg_key = cache_key
+            self._last_reg = (coef, intercept, r2_score)
         
-        # Ensure non-negative projections
-        df['projected_fp_per_game'] = df['projected_fp_per_game'].clip(lower=0)
+        print(f"✓ Regression model R² score: {r2_score:.3f}")
+        print(f"  Coefficient: {coef:.3f}, Intercept: {intercept:.3f}")
         
-        # Calculate projected season total (assuming 82 games)
-        df['projected_season_fp'] = df['projected_fp_per_game'] * 82
+        return coef, intercept
+    
+    def _penalty_vec(self, total_price: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Budget penalty fraction for one total price or an array of them.
         
-        return df
+        Args:
+            total_price: Lineup price or NumPy array of lineup prices
+            
+        Returns:
+            Penalty fraction with the same shape as total_price
+        """
+        return np.maximum(0.0, total_price - self.base_budget) * self.penalty_rate
     
     def calculate_penalty(self, total_price: float) -> float:
         """Calculate budget penalty percentage."""
-        if total_price <= self.base_budget:
-            return 0.0
-        
-        overage = total_price - self.base_budget
-        return overage * self.penalty_rate
+        return float(self._penalty_vec(total_price))
     
-    def objective_function(self, x: np.ndarray, df: pd.DataFrame) -> float:
+    def objective_function(self, x: np.ndarray, price: np.ndarray, proj: np.ndarray) -> Union[float, np.ndarray]:
         """
         Objective function to minimize (negative of net fantasy points).
+        Evaluated on the relaxed selection so that it is differentiable.
         
         Args:
-            x: Binary array indicating selected players
-            df: DataFrame with player data
+            x: Selection weights in [0, 1] for each player, or a 2-D array with
+               one candidate selection per row
+            price: Player prices (float64)
+            proj: Projected season fantasy points (float64)
             
         Returns:
-            Negative net fantasy points (for minimization)
+            Negative net fantasy points (for minimization), one per row for 2-D x
         """
-        # Convert to binary
-        selected = x > 0.5
-        
-        if not np.any(selected):
-            return 1e10  # Large penalty for empty selection
-        
-        selected_players = df[selected]
-        
-        # Calculate totals
-        total_price = selected_players['price'].sum()
-        total_projected_fp = selected_players['projected_season_fp'].sum()
-        
-        # Apply penalty
-        penalty = self.calculate_penalty(total_price)
-        net_fp = total_projected_fp * (1.0 - penalty)
+        if np.ndim(x) == 2:
+            # Score a batch of candidate selections at once
+            return -(x @ proj) * (1.0 - self._penalty_vec(x @ price))
+        
+        return _net_points_objective(
+            np.ascontiguousarray(x, dtype=np.float64),
+            price,
+            proj,
+            self.base_budget,
+            self.penalty_rate
+        )
+    
+    def _roster_matrix(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build the roster equality constraints A @ x == b for the prepared players.
+        Row 0 counts all selected players, the other rows one position each.
         
-        # Return negative for minimization
-        return -net_fp
+        Returns:
+            Tuple of (A, b) with A of shape (1 + positions, n_players)
+        """
+        pos_code = self._arrays['pos_code']
+        codes = np.arange(len(self.position_requirements), dtype=np.int8)
+        A = np.vstack([np.ones(len(pos_code)), (pos_code == codes[:, None]).astype(float)])
+        b = np.array([self.total_players] + list(self.position_requirements.values()), dtype=float)
+        return A, b
     
     def optimize_lineup(
         self,
         players: List[Dict],
-        method: str = 'SLSQP',
+        method: str = 'milp',
         verbose: bool = True
     ) -> Tuple[List[Dict], float, float, pd.DataFrame]:
         """
-        Optimize lineup using non-linear constrained optimization.
+        Optimize lineup using mixed-integer linear programming.
         
         Args:
             players: List of player dictionaries
-            method: Optimization method ('SLSQP' or 'trust-constr')
+            method: Optimization method ('milp', 'greedy', 'SLSQP' or 'trust-constr')
             verbose: Whether to print progress
             
         Returns:
@@ -212,65 +359,266 @@ class AdvancedLineupOptimizer:
             print(f"  Average GS/G: {df['gs_per_game'].mean():.3f}")
             print(f"  Average projected FP/G: {df['projected_fp_per_game'].mean():.2f}")
         
-        # Group by position
-        position_groups = {pos: df[df['position'] == pos].index.tolist() 
-                          for pos in ['G', 'D', 'F']}
+        for pos in self.position_requirements:
+            if not (self._arrays['positions'] == pos).any():
+                print(f"⚠️  Warning: No {pos} players available!")
+        
+        if method == 'milp' and milp is None:
+            print("⚠️  scipy.optimize.milp not available (SciPy < 1.9), falling back to greedy search")
+            method = 'greedy'
+        
+        if method in ('milp', 'greedy'):
+            if method == 'milp':
+                selected_df = self._optimize_milp(df, verbose)
+            else:
+                selected_df = self._optimize_greedy(df, verbose)
+            if selected_df is None:
+                print("❌ No feasible lineup satisfies the position and budget constraints")
+                return [], 0.0, 0.0, df
+        else:
+            selected_df = self._optimize_continuous(df, method, verbose)
+        
+        # Order the lineup by position (G, D, F), best projection first
+        selected = selected_df.index.to_numpy()
+        order = np.lexsort((-self._arrays['proj'][selected], self._arrays['pos_code'][selected]))
+        selected_df = selected_df.iloc[order]
+        
+        # Calculate final metrics
+        total_cost = selected_df['price'].sum()
+        total_projected = selected_df['projected_season_fp'].sum()
+        penalty = self.calculate_penalty(total_cost)
+        net_points = total_projected * (1.0 - penalty)
+        
+        # Convert back to player dictionaries
+        columns = ['name', 'position', 'team', 'price', 'projected_season_fp',
+                   'gs_per_game', 'projected_fp_per_game', 'games']
+        lineup = [
+            {
+                'name': name,
+                'position': position,
+                'team': team,
+                'cena': price,
+                'projected_points': projected,
+                'gs_per_game': gs_per_game,
+                'fp_per_game': fp_per_game,
+                'games': games
+            }
+            for name, position, team, price, projected, gs_per_game, fp_per_game, games
+            in zip(*(selected_df[column].tolist() for column in columns))
+        ]
+        
+        return lineup, total_cost, net_points, df
+    
+    def _optimize_milp(self, df: pd.DataFrame, verbose: bool = True) -> Optional[pd.DataFrame]:
+        """
+        Select the lineup exactly with a single mixed-integer linear program.
+        
+        The penalised objective points * (1 - rate * overage) is bilinear, so it is
+        linearised with an overage variable o >= price·x - base_budget and one
+        product variable w_i >= o - M * (1 - x_i) per player (w_i equals o when the
+        player is picked, 0 otherwise). Minimising -proj·x + rate * proj·w then
+        gives the exact penalised optimum, as projections are non-negative.
         
+        Args:
+            df: DataFrame with price, position and projected_season_fp columns
+            verbose: Whether to print progress
+            
+        Returns:
+            DataFrame of selected players, or None if no feasible lineup exists
+        """
         n_players = len(df)
+        price = self._arrays['price']
+        proj = self._arrays['proj']
+        max_overage = max(self.max_budget - self.base_budget, 0.0)
+        
+        # Variables: x (selection), w (x * overage), o (overage)
+        c = np.concatenate([-proj, self.penalty_rate * proj, [0.0]])
+        
+        # Equality rows: total players, then one row per position
+        A_roster, b_roster = self._roster_matrix()
+        A_roster = sparse.hstack([sparse.csr_matrix(A_roster), sparse.csr_matrix((len(b_roster), n_players + 1))])
+        
+        # price·x <= max_budget and price·x - o <= base_budget
+        A_budget = np.zeros((2, 2 * n_players + 1))
+        A_budget[:, :n_players] = price
+        A_budget[1, -1] = -1.0
+        
+        # o - w_i + M * x_i <= M, i.e. w_i >= o - M * (1 - x_i)
+        A_link = sparse.hstack([
+            max_overage * sparse.eye(n_players),
+            -sparse.eye(n_players),
+            sparse.csr_matrix(np.ones((n_players, 1)))
+        ])
+        
+        constraints = [
+            LinearConstraint(A_roster, b_roster, b_roster),
+            LinearConstraint(A_budget, -np.inf, [self.max_budget, self.base_budget]),
+            LinearConstraint(A_link, -np.inf, max_overage)
+        ]
+        integrality = np.concatenate([np.ones(n_players), np.zeros(n_players + 1)])
+        bounds = Bounds(
+            np.zeros(2 * n_players + 1),
+            np.concatenate([np.ones(n_players), np.full(n_players + 1, max_overage)])
+        )
         
-        # Define constraints
-        constraints = []
+        if verbose:
+            print(f"\n🎯 Running MILP optimization...")
+            print(f"  Constraints: {len(b_roster) + 2 + n_players}")
+            print(f"  Variables: {2 * n_players + 1}")
         
-        # Total players = 12
-        constraints.append({
-            'type': 'eq',
-            'fun': lambda x: np.sum(x) - self.total_players
-        })
+        result = milp(c, constraints=constraints, integrality=integrality, bounds=bounds)
+        
+        if not result.success:
+            if verbose:
+                print(f"⚠️  MILP failed: {result.message}")
+            return None
+        
+        x = np.round(result.x[:n_players])
+        return df[x > 0.5].copy()
+    
+    def _position_rankings(self) -> Dict[str, np.ndarray]:
+        """
+        Player indices per position, best value per cost first.
+        
+        Returns:
+            Dictionary mapping position to sorted player indices
+        """
+        pos_code = self._arrays['pos_code']
+        
+        # One sort groups players by position code and ranks them within each group
+        order = np.lexsort((-self._arrays['value_per_cost'], pos_code))
+        bounds = np.searchsorted(pos_code[order], np.arange(len(self.position_requirements) + 1))
+        
+        return {
+            pos: order[bounds[code]:bounds[code + 1]]
+            for code, pos in enumerate(self.position_requirements)
+        }
+    
+    def _budget_cents(self) -> Tuple[int, int]:
+        """Base and maximum budget in integer cents."""
+        return int(round(self.base_budget * 100)), int(round(self.max_budget * 100))
+    
+    def _optimize_greedy(self, df: pd.DataFrame, verbose: bool = True) -> Optional[pd.DataFrame]:
+        """
+        Select the lineup greedily by value per cost, then refine it with swaps.
+        
+        Starts from the best value players of each position and applies
+        same-position swaps while they raise net points. Needs no solver and is
+        used when milp is not available.
         
-        # Position requirements
+        Args:
+            df: DataFrame with player data and value_per_cost column
+            verbose: Whether to print progress
+            
+        Returns:
+            DataFrame of selected players, or None if no feasible lineup exists
+        """
+        price_cents = self._arrays['price_cents']
+        base_cents, max_cents = self._budget_cents()
+        pos_sorted = self._position_rankings()
+        
+        if any(len(pos_sorted[pos]) < required
+               for pos, required in self.position_requirements.items()):
+            return None
+        
+        selected_mask = np.zeros(len(df), dtype=bool)
         for pos, required_count in self.position_requirements.items():
-            indices = position_groups.get(pos, [])
-            if not indices:
-                print(f"⚠️  Warning: No {pos} players available!")
-                continue
-                
-            def make_position_constraint(pos_indices, count):
-                return lambda x: np.sum(x[pos_indices]) - count
+            selected_mask[pos_sorted[pos][:required_count]] = True
+        
+        if price_cents[selected_mask].sum() > max_cents:
+            # Best value start is too expensive, start from the cheapest players
+            selected_mask[:] = False
+            for pos, required_count in self.position_requirements.items():
+                ranked = pos_sorted[pos]
+                selected_mask[ranked[np.argsort(price_cents[ranked], kind='stable')[:required_count]]] = True
+            if price_cents[selected_mask].sum() > max_cents:
+                return None
+        
+        if verbose:
+            print("\n🎯 Running greedy swap search...")
+            print(f"  Variables: {len(df)}")
+        
+        selected_mask = _swap_search(
+            selected_mask,
+            price_cents,
+            self._arrays['proj'],
+            self._arrays['pos_code'],
+            base_cents,
+            max_cents,
+            self.penalty_rate / 100.0
+        )
+        
+        return df[selected_mask].copy()
+    
+    def _optimize_continuous(self, df: pd.DataFrame, method: str, verbose: bool = True) -> pd.DataFrame:
+        """
+        Relax the selection to [0, 1] and solve with a continuous NLP solver.
+        
+        Kept as an explicit alternative to milp. The solver is warm-started from
+        the HiGHS LP relaxation, its solution is rounded to the top players of
+        each position and then polished with the greedy swap search.
+        
+        Args:
+            df: DataFrame with player data and value_per_cost column
+            method: scipy.optimize.minimize method ('SLSQP' or 'trust-constr')
+            verbose: Whether to print progress
             
-            constraints.append({
-                'type': 'eq',
-                'fun': make_position_constraint(indices, required_count)
-            })
-        
-        # Budget constraint (max budget)
-        constraints.append({
-            'type': 'ineq',
-            'fun': lambda x: self.max_budget - np.sum(df.loc[x > 0.5, 'price'])
-        })
+        Returns:
+            DataFrame of selected players
+        """
+        n_players = len(df)
+        price = self._arrays['price']
+        proj = self._arrays['proj']
         
-        # Bounds: each variable between 0 and 1
-        bounds = [(0, 1) for _ in range(n_players)]
+        pos_sorted = self._position_rankings()
         
-        # Initial guess: select top players by projected value per cost
-        df['value_per_cost'] = df['projected_season_fp'] / df['price']
+        # Define constraints (all linear, so their Jacobians are constant)
+        A_eq, b_eq = self._roster_matrix()
         
-        x0 = np.zeros(n_players)
+        # Skip positions without any players
+        has_players = A_eq.any(axis=1)
+        A_eq, b_eq = A_eq[has_players], b_eq[has_players]
         
-        # Start with best value players from each position
-        for pos, required_count in self.position_requirements.items():
-            pos_df = df[df['position'] == pos].nlargest(required_count, 'value_per_cost')
-            x0[pos_df.index] = 1.0
+        constraints = [
+            # Total players = 12 and position requirements
+            LinearConstraint(A_eq, b_eq, b_eq),
+            # Budget constraint (max budget)
+            LinearConstraint(price[None, :], -np.inf, self.max_budget)
+        ]
+        
+        # Bounds: each variable between 0 and 1
+        bounds = Bounds(np.zeros(n_players), np.ones(n_players))
+        
+        # Warm start from the LP relaxation (penalty left out, so it stays linear)
+        relaxed = linprog(
+            -proj,
+            A_ub=price[None, :],
+            b_ub=[self.max_budget],
+            A_eq=A_eq,
+            b_eq=b_eq,
+            bounds=(0, 1),
+            method='highs'
+        )
+        
+        if relaxed.status == 0:
+            x0 = relaxed.x
+        else:
+            # Start with best value players from each position
+            x0 = np.zeros(n_players)
+            for pos, required_count in self.position_requirements.items():
+                x0[pos_sorted[pos][:required_count]] = 1.0
         
         if verbose:
             print(f"\n🎯 Running {method} optimization...")
-            print(f"  Constraints: {len(constraints)}")
+            print(f"  Constraints: {len(b_eq) + 1}")
             print(f"  Variables: {n_players}")
         
         # Run optimization
         result = minimize(
-            self.objective_function,
+            _net_points_objective,
             x0,
-            args=(df,),
+            args=(price, proj, self.base_budget, self.penalty_rate),
+            jac=_net_points_gradient,
             method=method,
             bounds=bounds,
             constraints=constraints,
@@ -280,87 +628,85 @@ class AdvancedLineupOptimizer:
         if not result.success:
             print(f"⚠️  Optimization warning: {result.message}")
         
-        # Round to binary (select top 12 values closest to 1)
-        x_binary = np.zeros(n_players)
-        top_indices = np.argsort(result.x)[-self.total_players:]
-        x_binary[top_indices] = 1
-        
-        # Verify position constraints
-        selected_df = df[x_binary > 0.5].copy()
-        
-        # Check if we meet position requirements
-        for pos, required_count in self.position_requirements.items():
-            actual_count = len(selected_df[selected_df['position'] == pos])
-            if actual_count != required_count:
-                if verbose:
-                    print(f"⚠️  Position constraint violation: {pos} has {actual_count}, need {required_count}")
-                # Try to fix by swapping players
-                selected_df = self._fix_position_constraints(df, selected_df)
-        
-        # Calculate final metrics
-        total_cost = selected_df['price'].sum()
-        total_projected = selected_df['projected_season_fp'].sum()
-        penalty = self.calculate_penalty(total_cost)
-        net_points = total_projected * (1.0 - penalty)
-        
-        # Convert back to player dictionaries
-        lineup = []
-        for idx, row in selected_df.iterrows():
-            player_dict = {
-                'name': row['name'],
-                'position': row['position'],
-                'team': row['team'],
-                'cena': row['price'],
-                'projected_points': row['projected_season_fp'],
-                'gs_per_game': row['gs_per_game'],
-                'fp_per_game': row['projected_fp_per_game'],
-                'games': row['games']
-            }
-            lineup.append(player_dict)
-        
-        return lineup, total_cost, net_points, df
+        # Round to binary per position (ties keep the value per cost order).
+        # If the solver's rounding breaks the budget, round the LP relaxation,
+        # and failing that start from the cheapest players.
+        price_cents = self._arrays['price_cents']
+        base_cents, max_cents = self._budget_cents()
+        for x in (result.x, x0, -price):
+            selected_mask = np.zeros(n_players, dtype=bool)
+            for pos, required_count in self.position_requirements.items():
+                ranked = pos_sorted[pos]
+                selected_mask[ranked[np.argsort(-x[ranked], kind='stable')[:required_count]]] = True
+            if price_cents[selected_mask].sum() <= max_cents:
+                break
+        
+        # Verify position constraints, fixing violations by swapping players
+        selected_mask = self._fix_position_constraints(selected_mask, pos_sorted, verbose)
+        
+        # Polish the rounded lineup when it is within budget
+        if price_cents[selected_mask].sum() <= max_cents:
+            selected_mask = _swap_search(
+                selected_mask,
+                price_cents,
+                proj,
+                self._arrays['pos_code'],
+                base_cents,
+                max_cents,
+                self.penalty_rate / 100.0
+            )
+        
+        return df[selected_mask].copy()
     
     def _fix_position_constraints(
         self,
-        full_df: pd.DataFrame,
-        selected_df: pd.DataFrame
-    ) -> pd.DataFrame:
+        selected_mask: np.ndarray,
+        pos_sorted: Dict[str, np.ndarray],
+        verbose: bool = True
+    ) -> np.ndarray:
         """
         Attempt to fix position constraint violations by swapping players.
         
         Args:
-            full_df: Full player DataFrame
-            selected_df: Currently selected players
+            selected_mask: Boolean selection over all prepared players
+            pos_sorted: Player indices per position, sorted by value_per_cost descending
+            verbose: Whether to report violations
             
         Returns:
-            Fixed DataFrame
+            Fixed selection mask
         """
-        # Count current positions
-        position_counts = selected_df['position'].value_counts().to_dict()
+        selected_mask = selected_mask.copy()
+        
+        # Count current positions (codes follow position_requirements order)
+        position_counts = np.bincount(
+            self._arrays['pos_code'][selected_mask],
+            minlength=len(self.position_requirements)
+        )
         
-        for pos, required in self.position_requirements.items():
-            current = position_counts.get(pos, 0)
+        for code, (pos, required) in enumerate(self.position_requirements.items()):
+            current = position_counts[code]
+            ranked = pos_sorted.get(pos, np.empty(0, dtype=int))
+            
+            if current != required and verbose:
+                print(f"⚠️  Position constraint violation: {pos} has {current}, need {required}")
             
             if current < required:
                 # Need more of this position
                 deficit = required - current
-                available = full_df[(full_df['position'] == pos) & 
-                                   (~full_df.index.isin(selected_df.index))]
+                available = ranked[~selected_mask[ranked]]
                 
                 if len(available) >= deficit:
                     # Add best available
-                    to_add = available.nlargest(deficit, 'value_per_cost')
-                    selected_df = pd.concat([selected_df, to_add])
+                    selected_mask[available[:deficit]] = True
             
             elif current > required:
                 # Have too many of this position
                 excess = current - required
-                pos_players = selected_df[selected_df['position'] == pos]
+                pos_selected = ranked[selected_mask[ranked]]
                 # Remove worst performers
-                to_remove = pos_players.nsmallest(excess, 'value_per_cost')
-                selected_df = selected_df[~selected_df.index.isin(to_remove.index)]
+                selected_mask[pos_selected[-excess:]] = False
         
-        return selected_df
+        return selected_mask
     
     def generate_report(
         self,
@@ -370,45 +716,39 @@ class AdvancedLineupOptimizer:
         df: pd.DataFrame
     ) -> str:
         """Generate detailed optimization report."""
-        lines = []
-        lines.append("=" * 80)
-        lines.append("ADVANCED OPTIMIZATION RESULTS")
-        lines.append("=" * 80)
-        lines.append("")
-        
-        # Calculate metrics
         total_projected = sum(p['projected_points'] for p in lineup)
         penalty = self.calculate_penalty(total_cost)
+        rule = "=" * 80
         
-        lines.append(f"Total Cost: ${total_cost:.2f}M")
-        lines.append(f"Base Budget: ${self.base_budget:.2f}M")
-        lines.append(f"Overage: ${max(0, total_cost - self.base_budget):.2f}M")
-        lines.append(f"Penalty: {penalty*100:.2f}%")
-        lines.append("")
-        lines.append(f"Projected Season Points: {total_projected:.1f}")
-        lines.append(f"Net Points (after penalty): {net_points:.1f}")
-        lines.append("")
-        
-        # Lineup by position
-        for pos in ['G', 'D', 'F']:
-            pos_name = {'G': 'GOALKEEPERS', 'D': 'DEFENDERS', 'F': 'FORWARDS'}[pos]
-            pos_players = [p for p in lineup if p['position'] == pos]
-            
-            lines.append(f"\n{pos_name}:")
-            lines.append("-" * 80)
-            
-            for p in sorted(pos_players, key=lambda x: x['projected_points'], reverse=True):
-                lines.append(
-                    f"  {p['name']:30s} {p['team']:4s} | "
-                    f"${p['cena']:5.2f}M | "
-                    f"GS/G: {p['gs_per_game']:5.3f} | "
-                    f"Proj: {p['projected_points']:6.1f}"
-                )
-        
-        lines.append("")
-        lines.append("=" * 80)
-        
-        return "\n".join(lines)
+        header = f"""{rule}
+ADVANCED OPTIMIZATION RESULTS
+{rule}
+
+Total Cost: ${total_cost:.2f}M
+Base Budget: ${self.base_budget:.2f}M
+Overage: ${max(0, total_cost - self.base_budget):.2f}M
+Penalty: {penalty*100:.2f}%
+
+Projected Season Points: {total_projected:.1f}
+Net Points (after penalty): {net_points:.1f}
+
+"""
+        
+        # Lineup by position, best projection first (one stable sort for all positions)
+        pos_names = {'G': 'GOALKEEPERS', 'D': 'DEFENDERS', 'F': 'FORWARDS'}
+        ranked = sorted(lineup, key=lambda x: x['projected_points'], reverse=True)
+        sections = "\n".join(
+            f"\n{pos_names[pos]}:\n" + "-" * 80 + "".join(
+                f"\n  {p['name']:30s} {p['team']:4s} | "
+                f"${p['cena']:5.2f}M | "
+                f"GS/G: {p['gs_per_game']:5.3f} | "
+                f"Proj: {p['projected_points']:6.1f}"
+                for p in ranked if p['position'] == pos
+            )
+            for pos in pos_names
+        )
+        
+        return f"{header}{sections}\n\n{rule}"
 
 
 # Example usage
@@ -2,24 +2,36 @@
 import json
 import os
 
+try:
+    import ijson  # Streams only the parts of the file we print
+except ImportError:
+    ijson = None
+
 cache_file = "cache/player_8479318.json"
 
 if os.path.exists(cache_file):
-    with open(cache_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    print("Season Totals in cache:")
-    for season in data.get('seasonTotals', []):
-        if season.get('leagueAbbrev') == 'NHL' and season.get('gameTypeId') == 2:
-            print(f"  {season.get('season')}: {season.get('gamesPlayed')} GP, "
-                  f"{season.get('goals')} G, {season.get('assists')} A, "
-                  f"PIM: {season.get('pim')}")
-    
+    with open(cache_file, 'rb') as f:
+        if ijson:
+            season_totals = ijson.items(f, 'seasonTotals.item')
+        else:
+            data = json.load(f)
+            season_totals = data.get('seasonTotals', [])
+
+        print("Season Totals in cache:")
+        for season in season_totals:
+            if season.get('leagueAbbrev') == 'NHL' and season.get('gameTypeId') == 2:
+                print(f"  {season.get('season')}: {season.get('gamesPlayed')} GP, "
+                      f"{season.get('goals')} G, {season.get('assists')} A, "
+                      f"PIM: {season.get('pim')}")
+
+        if ijson:
+            f.seek(0)
+            sub = next(ijson.items(f, 'featuredStats.regularSeason.subSeason'), None)
+        else:
+            sub = data.get('featuredStats', {}).get('regularSeason', {}).get('subSeason')
+
     print("\nFeatured Stats:")
-    if 'featuredStats' in data:
-        reg = data['featuredStats'].get('regularSeason', {})
-        if 'subSeason' in reg:
-            sub = reg['subSeason']
-            print(f"  Current: {sub.get('gamesPlayed')} GP, "
-                  f"{sub.get('goals')} G, {sub.get('assists')} A, "
-                  f"PIM: {sub.get('pim')}")
+    if sub is not None:
+        print(f"  Current: {sub.get('gamesPlayed')} GP, "
+              f"{sub.get('goals')} G, {sub.get('assists')} A, "
+              f"PIM: {sub.get('pim')}")
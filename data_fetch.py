@@ -5,17 +5,339 @@ It supports both current season and historical data for comprehensive analysis.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import csv
 import os
 import re
 import time
-import shutil
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-import difflib
 from pathlib import Path
 import unicodedata
+import functools
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import httpx  # Optional, fetches uncached rosters concurrently
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+try:
+    import orjson  # Optional, much faster JSON for cache and export files
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional, streams very large player files
+except ImportError:
+    ijson = None
+
+try:
+    from rapidfuzz import fuzz, process as rf_process  # Optional, C++ fuzzy matching
+except ImportError:
+    fuzz = rf_process = None
+
+
+def _json_load(path: str):
+    """Reads a JSON file, with orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _json_loads(data: bytes):
+    """Parses a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _unwrap(value, key: str = 'default') -> str:
+    """NHL API localized field ({"default": "Connor", "cs": ...}) or plain string -> string"""
+    if isinstance(value, dict):
+        return value.get(key, '')
+    return value or ''
+
+
+def _meta_path(cache_file: str) -> str:
+    """roster_TOR_20242025.json -> roster_TOR_20242025.meta.json (HTTP validators)"""
+    return f"{os.path.splitext(cache_file)[0]}.meta.json"
+
+
+def _json_dump(data, path: str, indent: bool = True) -> None:
+    """
+    Writes data as UTF-8 JSON, with orjson when it is installed; indented for
+    files people read, compact (no indentation whitespace) for the API cache.
+    The file is written under a temporary name and moved into place with
+    os.replace, so an interrupted write never leaves a truncated file behind.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        payload = orjson.dumps(data, option=option)
+    elif indent:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    else:
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    
+    # Unique per writer so concurrent saves of the same file cannot collide
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Patterns used per row/name in the price parsing and matching loops
+_PRICE_CELL_RE = re.compile(r'[\d\.\,]+')
+_NON_PRICE_CHARS_RE = re.compile(r'[^\d\.]')
+# Deletes every Latin-1 character except digits and the decimal dot
+_PRICE_KEEP = {cp: None for cp in range(256) if chr(cp) not in '0123456789.'}
+# Anything left in a lowercased name that is not an ASCII letter, digit or space
+_NON_NAME_CHARS_RE = re.compile(r'[^a-z0-9 ]+', re.ASCII)
+# Header cells of price files (matched anywhere in the lowercased first cell)
+_HEADER_RE = re.compile('|'.join(map(re.escape, ['hráč', 'player', 'name', 'cena', 'price'])))
+
+# Deletes every combining mark (diacritics left over after NFKD); all of them
+# live in the first two Unicode planes
+_COMBINING_MARKS = {cp: None for cp in range(0x20000) if unicodedata.combining(chr(cp))}
+
+# Accented Latin letters folded straight to their ASCII base (é -> e, ň -> n), the
+# same result NFKD plus combining-mark removal gives, without decomposing
+_FOLD = {}
+for _cp in range(0x80, 0x250):
+    _folded = unicodedata.normalize('NFKD', chr(_cp)).translate(_COMBINING_MARKS).lower()
+    if _folded and _folded.isascii():
+        _FOLD[_cp] = _folded
+del _cp, _folded
+
+# Single-pass character replacements (decimal comma, name punctuation)
+_DECIMAL_COMMA = str.maketrans(',', '.')
+_NAME_PUNCTUATION = str.maketrans('.,\t\n\r\f\v', '       ')
+
+def _detect_price_format(row: List[str]) -> Optional[str]:
+    """Returns the price format of a CSV row, or None if it is not recognised."""
+    # Name, whole, decimal -> ["Makar C.", "30", "9"]
+    if len(row) >= 3 and row[1].strip().isdecimal() and row[2].strip().isdecimal():
+        return "split_decimal"
+    # Name, price with comma or dot -> ["Connor McDavid", "14,5"] or ["Name", "14.5"]
+    if _PRICE_CELL_RE.fullmatch(row[1].strip()):
+        return "single_cell"
+    return None
+
+
+def _parse_split_decimal_price(row: List[str]) -> Optional[float]:
+    """["Makar C.", "30", "9"] -> 30.9"""
+    if len(row) < 3:
+        return None
+    whole, decimal = row[1].strip(), row[2].strip()
+    if not (whole.isdecimal() and decimal.isdecimal()):
+        return None
+    return float(f"{whole}.{decimal}")
+
+
+def _parse_single_cell_price(row: List[str]) -> Optional[float]:
+    """["Connor McDavid", "14,5"] -> 14.5"""
+    if len(row) < 2:
+        return None
+    # Decimal comma to dot, then drop anything but digits and dots
+    price_str = row[1].strip().translate(_DECIMAL_COMMA)
+    try:
+        return float(price_str.translate(_PRICE_KEEP))
+    except ValueError:
+        pass
+    # Characters outside Latin-1 (e.g. a euro sign) survive the table
+    try:
+        return float(_NON_PRICE_CHARS_RE.sub('', price_str))
+    except ValueError:
+        return None
+
+
+def _parse_any_price(row: List[str]) -> Optional[float]:
+    """Tries both formats while the file's format is still unknown."""
+    if len(row) >= 3 and row[1].strip().isdecimal() and row[2].strip().isdecimal():
+        return _parse_split_decimal_price(row)
+    return _parse_single_cell_price(row)
+
+
+_PRICE_PARSERS = {
+    "split_decimal": _parse_split_decimal_price,
+    "single_cell": _parse_single_cell_price,
+}
+
+# Common NHL star names mapped to their likely price file format
+COMMON_PLAYER_MAP = {
+    "connor mcdavid": "mcdavid c.",
+    "cale makar": "makar c.",
+    "auston matthews": "matthews a.",
+    "david pastrnak": "pastrňák d.",
+    "kirill kaprizov": "kaprizov k.",
+    "nathan mackinnon": "mackinnon n.",
+    "tage thompson": "thompson t.",
+    "nikita kucherov": "kucherov n.",
+    "alexander ovechkin": "ovechkin a.",
+    "brady tkachuk": "tkachuk b.",
+    "matthew tkachuk": "tkachuk m.",
+    "leon draisaitl": "draisaitl l.",
+    "mitch marner": "marner m.",
+    "quinn hughes": "hughes q.",
+    "jack hughes": "hughes j.",
+    "luke hughes": "hughes l.",
+    "sidney crosby": "crosby s.",
+    "steven stamkos": "stamkos s.",
+    "elias pettersson": "pettersson e.",
+    "mark scheifele": "scheifele m.",
+    "sebastian aho": "aho s.",
+    "patrik laine": "laine p.",
+    "aleksander barkov": "barkov a.",
+    "brad marchand": "marchand b.",
+}
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_name_cached(name: str) -> str:
+    """Return a normalized name for comparison."""
+    if not name:
+        return ''
+    # Remove diacritics: a plain table covers Latin names, full NFKD only runs
+    # for whatever it leaves behind (Cyrillic, ligatures, ...)
+    name = name.lower().translate(_FOLD)
+    if not name.isascii():
+        name = unicodedata.normalize('NFKD', name).translate(_COMBINING_MARKS).lower()
+    # Remove special chars, keep alphanumerics and single spaces
+    name = _NON_NAME_CHARS_RE.sub('', name.translate(_NAME_PUNCTUATION))
+    return ' '.join(name.split())
+
+
+@functools.lru_cache(maxsize=8192)
+def _name_variants_cached(name: str) -> Tuple[str, ...]:
+    """Name variants for matching, most specific first, see NHLDataFetcher._generate_name_variants."""
+    # Original name is always included, plus its normalized form
+    norm_name = _normalize_name_cached(name)
+    base = [name.lower(), norm_name]
+    loose = []
+    
+    # Split into tokens for additional processing
+    tokens = norm_name.split()
+    
+    if len(tokens) >= 2:
+        first, last = tokens[0], tokens[-1]
+        first_initial = first[0]
+        base += [
+            f"{last} {first_initial}.",  # Makar C. - THIS IS THE PREFERRED FORMAT
+            f"{last} {first_initial}",   # Last name + first initial (common hockey format)
+            f"{first_initial} {last}",   # First initial + last name
+            f"{first} {last[0]}",        # First name + last name initial
+        ]
+        # Last name only, first name only - tried after everything else
+        loose = [last, first]
+    
+    # Each base form also without spaces and with dots instead of spaces; dict keeps
+    # that order and drops duplicates
+    variants = dict.fromkeys([
+        *base,
+        *(v.replace(' ', '') for v in base),
+        *(v.replace(' ', '.') for v in base),
+        *loose,
+    ])
+    
+    # Return tuple without empty strings
+    variants.pop('', None)
+    return tuple(variants)
+
+
+# COMMON_PLAYER_MAP with its values already in normalized (norm_prices) form
+_COMMON_PLAYER_MAP_NORMALIZED = {
+    name: _normalize_name_cached(price_name) for name, price_name in COMMON_PLAYER_MAP.items()
+}
+
+# Column types for load_from_csv (other columns are inferred)
+_CSV_DTYPES = {'cena': 'float64', 'id': 'Int64'}
+
+# Current NHL teams, used when the standings endpoint is unavailable
+_FALLBACK_TEAMS = (
+    {'abbrev': 'ANA', 'name': 'Anaheim Ducks'},
+    {'abbrev': 'BOS', 'name': 'Boston Bruins'},
+    {'abbrev': 'BUF', 'name': 'Buffalo Sabres'},
+    {'abbrev': 'CAR', 'name': 'Carolina Hurricanes'},
+    {'abbrev': 'CBJ', 'name': 'Columbus Blue Jackets'},
+    {'abbrev': 'CGY', 'name': 'Calgary Flames'},
+    {'abbrev': 'CHI', 'name': 'Chicago Blackhawks'},
+    {'abbrev': 'COL', 'name': 'Colorado Avalanche'},
+    {'abbrev': 'DAL', 'name': 'Dallas Stars'},
+    {'abbrev': 'DET', 'name': 'Detroit Red Wings'},
+    {'abbrev': 'EDM', 'name': 'Edmonton Oilers'},
+    {'abbrev': 'FLA', 'name': 'Florida Panthers'},
+    {'abbrev': 'LAK', 'name': 'Los Angeles Kings'},
+    {'abbrev': 'MIN', 'name': 'Minnesota Wild'},
+    {'abbrev': 'MTL', 'name': 'Montreal Canadiens'},
+    {'abbrev': 'NJD', 'name': 'New Jersey Devils'},
+    {'abbrev': 'NSH', 'name': 'Nashville Predators'},
+    {'abbrev': 'NYI', 'name': 'New York Islanders'},
+    {'abbrev': 'NYR', 'name': 'New York Rangers'},
+    {'abbrev': 'OTT', 'name': 'Ottawa Senators'},
+    {'abbrev': 'PHI', 'name': 'Philadelphia Flyers'},
+    {'abbrev': 'PIT', 'name': 'Pittsburgh Penguins'},
+    {'abbrev': 'SEA', 'name': 'Seattle Kraken'},
+    {'abbrev': 'SJS', 'name': 'San Jose Sharks'},
+    {'abbrev': 'STL', 'name': 'St. Louis Blues'},
+    {'abbrev': 'TBL', 'name': 'Tampa Bay Lightning'},
+    {'abbrev': 'TOR', 'name': 'Toronto Maple Leafs'},
+    {'abbrev': 'UTA', 'name': 'Utah Hockey Club'},
+    {'abbrev': 'VAN', 'name': 'Vancouver Canucks'},
+    {'abbrev': 'VGK', 'name': 'Vegas Golden Knights'},
+    {'abbrev': 'WPG', 'name': 'Winnipeg Jets'},
+    {'abbrev': 'WSH', 'name': 'Washington Capitals'},
+)
+
+# Player files larger than this are streamed with ijson when it is installed
+_JSON_STREAM_THRESHOLD = 50 * 1024 * 1024
+
+# Maximum number of decoded cache files kept in memory per fetcher
+_MEM_CACHE_SIZE = 1024
+
+# Retry policy for API requests, shared by the requests session and the httpx path:
+# rate limits and 5xx responses are retried with exponential backoff
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Rosters fetched at once; half of the session's 32 pooled connections, so
+# every worker gets a kept-alive connection
+_ROSTER_WORKERS = 16
+
+# Player landing pages fetched at once; matches the session's pool size
+_PLAYER_WORKERS = 32
+
+# Schedule days fetched at once (a multi-day lookup is a week or two at most)
+_SCHEDULE_WORKERS = 8
+
+# Minimum fuzzy name similarity (percent) for a price match candidate
+_FUZZY_SCORE_CUTOFF = 75
+
+# Players scored per RapidFuzz cdist call; bounds the float32 score matrix to
+# block x price keys (~25 MB for 256 players against 24k keys)
+_FUZZY_BLOCK_ROWS = 256
 
 
 class NHLDataFetcher:
@@ -29,9 +351,37 @@ class NHLDataFetcher:
         self.base_url = "https://api-web.nhle.com/v1"
         self.current_season = self._get_current_season()
         self.previous_season = self._get_previous_season()
+        # The API reports seasonTotals[].season as an integer (e.g. 20242025)
+        self.current_season_id = int(self.current_season)
+        self.previous_season_id = int(self.previous_season)
         self.cache_dir = cache_dir or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
         self.force_refresh = force_refresh
         self._ensure_cache_dir()
+        self.session = self._create_session()
+        # In-memory layer over the disk cache: path -> (mtime, data)
+        self._mem = {}
+        self._mem_lock = threading.Lock()
+        
+    def _create_session(self) -> requests.Session:
+        """
+        Creates a pooled HTTP session so all API calls reuse one keep-alive connection.
+        Transient failures (rate limits, 5xx) are retried with backoff.
+        """
+        session = requests.Session()
+        retry = Retry(
+            total=_RETRY_TOTAL,
+            backoff_factor=_RETRY_BACKOFF,
+            status_forcelist=list(_RETRY_STATUSES),
+            allowed_methods=['GET']
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+        session.mount('https://', adapter)
+        session.headers.update({
+            'User-Agent': 'TipsportAnalyzer/1.0',
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        return session
         
     def _ensure_cache_dir(self):
         """Creates cache directory if it doesn't exist."""
@@ -40,18 +390,100 @@ class NHLDataFetcher:
             
     def _cache_is_valid(self, cache_file, max_age_hours=12):
         """Check if cached data is still valid based on file modification time."""
-        if not os.path.exists(cache_file):
-            return False
-            
         if self.force_refresh:
             return False
-            
-        mod_time = os.path.getmtime(cache_file)
-        current_time = time.time()
-        age_hours = (current_time - mod_time) / 3600
+        
+        # One stat() call both checks existence and gives the mtime
+        try:
+            mod_time = os.stat(cache_file).st_mtime
+        except OSError:
+            return False
+        
+        age_hours = (time.time() - mod_time) / 3600
         
         return age_hours < max_age_hours
         
+    def _load_cache(self, cache_file: str):
+        """
+        Loads a cache file through the in-memory layer.
+        Entries are keyed by path and checked against the file's mtime,
+        so a file rewritten on disk is read again.
+        """
+        mtime = os.stat(cache_file).st_mtime_ns
+        with self._mem_lock:
+            entry = self._mem.get(cache_file)
+        if entry is None or entry[0] != mtime:
+            entry = (mtime, _json_load(cache_file))
+        self._remember(cache_file, entry)
+        return entry[1]
+    
+    def _save_cache(self, data, cache_file: str, response=None) -> None:
+        """
+        Writes data to the disk cache and the in-memory layer.
+        With the response the data came from, its ETag / Last-Modified are kept
+        next to the file for revalidating it later (see _get_json).
+        """
+        _json_dump(data, cache_file, indent=False)
+        self._remember(cache_file, (os.stat(cache_file).st_mtime_ns, data))
+        if response is not None:
+            _json_dump({
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            }, _meta_path(cache_file), indent=False)
+    
+    def _validator_headers(self, cache_file: str) -> Dict[str, str]:
+        """Conditional request headers for an existing cache file, empty if there are none."""
+        if self.force_refresh or not os.path.exists(cache_file):
+            return {}
+        try:
+            meta = _json_load(_meta_path(cache_file))
+        except (OSError, ValueError):
+            return {}
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+    
+    def _revalidated_cache(self, cache_file: str):
+        """
+        Cached data after the server answered 304 Not Modified. The file's mtime is
+        bumped so it counts as fresh for another cache period; None if it can't be read.
+        """
+        try:
+            os.utime(cache_file)
+            return self._load_cache(cache_file)
+        except (OSError, ValueError):
+            return None
+    
+    def _get_json(self, url: str, cache_file: str) -> Tuple[object, Optional[requests.Response]]:
+        """
+        GETs a JSON document for cache_file. An expired cache file is revalidated
+        with a conditional request instead of downloading the document again.
+        
+        Returns:
+            Tuple of (data, response); response is None when the server reported the
+            cached copy as unchanged and data was read from cache_file
+        """
+        headers = self._validator_headers(cache_file)
+        response = self.session.get(url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            cached = self._revalidated_cache(cache_file)
+            if cached is not None:
+                return cached, None
+            response = self.session.get(url, timeout=10)
+        response.raise_for_status()
+        return _json_loads(response.content), response
+    
+    def _remember(self, cache_file: str, entry: Tuple) -> None:
+        """Stores an (mtime, data) entry as most recently used, evicting the oldest."""
+        with self._mem_lock:
+            self._mem.pop(cache_file, None)
+            self._mem[cache_file] = entry
+            if len(self._mem) > _MEM_CACHE_SIZE:
+                self._mem.pop(next(iter(self._mem)))
+    
     def _get_current_season(self) -> str:
         """
         Determines the current NHL season based on today's date.
@@ -68,8 +500,7 @@ class NHLDataFetcher:
         """
         Returns the season before the current one.
         """
-        current = self._get_current_season()
-        start_year = int(current[:4])
+        start_year = int(self.current_season[:4])
         return f"{start_year - 1}{start_year}"
     
     def fetch_all_teams(self) -> List[Dict]:
@@ -83,25 +514,24 @@ class NHLDataFetcher:
         
         if self._cache_is_valid(cache_file, max_age_hours=168):  # Cache for 1 week
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return self._load_cache(cache_file)
             except Exception:
                 pass
         
         try:
             # NHL teams endpoint - using standings to get current teams
             url = f"{self.base_url}/standings/now"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            standings_data = response.json()
+            standings_data, response = self._get_json(url, cache_file)
+            if response is None:
+                return standings_data  # Unchanged, this is the cached team list
             
             teams = []
             seen_teams = set()
             
             # Extract teams from standings
             for standing in standings_data.get('standings', []):
-                team_abbrev = standing.get('teamAbbrev', {}).get('default', '')
-                team_name = standing.get('teamName', {}).get('default', '')
+                team_abbrev = _unwrap(standing.get('teamAbbrev'))
+                team_name = _unwrap(standing.get('teamName'))
                 
                 if team_abbrev and team_abbrev not in seen_teams:
                     teams.append({
@@ -113,102 +543,41 @@ class NHLDataFetcher:
             
             # If standings didn't work, use hardcoded list of current NHL teams
             if not teams:
-                teams = [
-                    {'abbrev': 'ANA', 'name': 'Anaheim Ducks'},
-                    {'abbrev': 'BOS', 'name': 'Boston Bruins'},
-                    {'abbrev': 'BUF', 'name': 'Buffalo Sabres'},
-                    {'abbrev': 'CAR', 'name': 'Carolina Hurricanes'},
-                    {'abbrev': 'CBJ', 'name': 'Columbus Blue Jackets'},
-                    {'abbrev': 'CGY', 'name': 'Calgary Flames'},
-                    {'abbrev': 'CHI', 'name': 'Chicago Blackhawks'},
-                    {'abbrev': 'COL', 'name': 'Colorado Avalanche'},
-                    {'abbrev': 'DAL', 'name': 'Dallas Stars'},
-                    {'abbrev': 'DET', 'name': 'Detroit Red Wings'},
-                    {'abbrev': 'EDM', 'name': 'Edmonton Oilers'},
-                    {'abbrev': 'FLA', 'name': 'Florida Panthers'},
-                    {'abbrev': 'LAK', 'name': 'Los Angeles Kings'},
-                    {'abbrev': 'MIN', 'name': 'Minnesota Wild'},
-                    {'abbrev': 'MTL', 'name': 'Montreal Canadiens'},
-                    {'abbrev': 'NJD', 'name': 'New Jersey Devils'},
-                    {'abbrev': 'NSH', 'name': 'Nashville Predators'},
-                    {'abbrev': 'NYI', 'name': 'New York Islanders'},
-                    {'abbrev': 'NYR', 'name': 'New York Rangers'},
-                    {'abbrev': 'OTT', 'name': 'Ottawa Senators'},
-                    {'abbrev': 'PHI', 'name': 'Philadelphia Flyers'},
-                    {'abbrev': 'PIT', 'name': 'Pittsburgh Penguins'},
-                    {'abbrev': 'SEA', 'name': 'Seattle Kraken'},
-                    {'abbrev': 'SJS', 'name': 'San Jose Sharks'},
-                    {'abbrev': 'STL', 'name': 'St. Louis Blues'},
-                    {'abbrev': 'TBL', 'name': 'Tampa Bay Lightning'},
-                    {'abbrev': 'TOR', 'name': 'Toronto Maple Leafs'},
-                    {'abbrev': 'UTA', 'name': 'Utah Hockey Club'},
-                    {'abbrev': 'VAN', 'name': 'Vancouver Canucks'},
-                    {'abbrev': 'VGK', 'name': 'Vegas Golden Knights'},
-                    {'abbrev': 'WPG', 'name': 'Winnipeg Jets'},
-                    {'abbrev': 'WSH', 'name': 'Washington Capitals'}
-                ]
+                teams = [dict(team) for team in _FALLBACK_TEAMS]
             
             # Save to cache
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(teams, f, ensure_ascii=False, indent=2)
+            self._save_cache(teams, cache_file, response)
             
             return teams
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Error fetching teams: {e}")
             # Return hardcoded list as fallback
-            return [
-                {'abbrev': 'ANA', 'name': 'Anaheim Ducks'},
-                {'abbrev': 'BOS', 'name': 'Boston Bruins'},
-                {'abbrev': 'BUF', 'name': 'Buffalo Sabres'},
-                {'abbrev': 'CAR', 'name': 'Carolina Hurricanes'},
-                {'abbrev': 'CBJ', 'name': 'Columbus Blue Jackets'},
-                {'abbrev': 'CGY', 'name': 'Calgary Flames'},
-                {'abbrev': 'CHI', 'name': 'Chicago Blackhawks'},
-                {'abbrev': 'COL', 'name': 'Colorado Avalanche'},
-                {'abbrev': 'DAL', 'name': 'Dallas Stars'},
-                {'abbrev': 'DET', 'name': 'Detroit Red Wings'},
-                {'abbrev': 'EDM', 'name': 'Edmonton Oilers'},
-                {'abbrev': 'FLA', 'name': 'Florida Panthers'},
-                {'abbrev': 'LAK', 'name': 'Los Angeles Kings'},
-                {'abbrev': 'MIN', 'name': 'Minnesota Wild'},
-                {'abbrev': 'MTL', 'name': 'Montreal Canadiens'},
-                {'abbrev': 'NJD', 'name': 'New Jersey Devils'},
-                {'abbrev': 'NSH', 'name': 'Nashville Predators'},
-                {'abbrev': 'NYI', 'name': 'New York Islanders'},
-                {'abbrev': 'NYR', 'name': 'New York Rangers'},
-                {'abbrev': 'OTT', 'name': 'Ottawa Senators'},
-                {'abbrev': 'PHI', 'name': 'Philadelphia Flyers'},
-                {'abbrev': 'PIT', 'name': 'Pittsburgh Penguins'},
-                {'abbrev': 'SEA', 'name': 'Seattle Kraken'},
-                {'abbrev': 'SJS', 'name': 'San Jose Sharks'},
-                {'abbrev': 'STL', 'name': 'St. Louis Blues'},
-                {'abbrev': 'TBL', 'name': 'Tampa Bay Lightning'},
-                {'abbrev': 'TOR', 'name': 'Toronto Maple Leafs'},
-                {'abbrev': 'UTA', 'name': 'Utah Hockey Club'},
-                {'abbrev': 'VAN', 'name': 'Vancouver Canucks'},
-                {'abbrev': 'VGK', 'name': 'Vegas Golden Knights'},
-                {'abbrev': 'WPG', 'name': 'Winnipeg Jets'},
-                {'abbrev': 'WSH', 'name': 'Washington Capitals'}
-            ]
+            return [dict(team) for team in _FALLBACK_TEAMS]
     
     def clear_cache(self):
         """
         Clears all cached data to ensure fresh data on next fetch.
         Handles permission errors gracefully.
         """
+        import shutil  # Only needed here
+        
+        with self._mem_lock:
+            self._mem.clear()
+        
         if os.path.exists(self.cache_dir):
             try:
-                # Try to remove individual files first - often helps with permission issues
-                for filename in os.listdir(self.cache_dir):
-                    file_path = os.path.join(self.cache_dir, filename)
-                    try:
-                        if os.path.isfile(file_path):
-                            os.unlink(file_path)
-                        elif os.path.isdir(file_path):
-                            shutil.rmtree(file_path)
-                    except Exception as e:
-                        print(f"Warning: Could not remove {file_path}: {e}")
+                # Try to remove individual files first - often helps with permission issues.
+                # scandir entries know their type, so no extra stat() per file
+                with os.scandir(self.cache_dir) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                shutil.rmtree(entry.path)
+                            else:
+                                os.unlink(entry.path)
+                        except Exception as e:
+                            print(f"Warning: Could not remove {entry.path}: {e}")
                 
                 # Try to remove the directory itself
                 try:
@@ -251,26 +620,147 @@ class NHLDataFetcher:
         
         if self._cache_is_valid(cache_file):
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return self._load_cache(cache_file)
             except Exception:
                 pass  # If there's any issue loading cache, fetch fresh data
             
         try:
             url = f"{self.base_url}/roster/{team_abbr}/{season}"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            roster_data = response.json()
+            roster_data, response = self._get_json(url, cache_file)
             
             # Save to cache
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(roster_data, f, ensure_ascii=False, indent=2)
+            if response is not None:
+                self._save_cache(roster_data, cache_file, response)
                 
             return roster_data
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Error fetching roster for {team_abbr} ({season}): {e}")
             return []
     
+    def _can_fetch_async(self) -> bool:
+        """
+        True when requests can go through httpx: it is installed and no event loop
+        is running in this thread (asyncio.run would fail inside one).
+        """
+        if httpx is None:
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+        return False
+    
+    def _gather_async(self, fetch, items: List, max_connections: int) -> List:
+        """
+        Runs fetch(client, item) for every item concurrently over one httpx.AsyncClient
+        that sends the session's headers. Check _can_fetch_async first.
+        
+        Returns:
+            List of results in item order, with exceptions returned in place of results
+        """
+        # Connection-specific headers are not allowed over HTTP/2
+        headers = {key: value for key, value in self.session.headers.items()
+                   if key.lower() != 'connection'}
+        
+        async def gather():
+            limits = httpx.Limits(max_connections=max_connections,
+                                  max_keepalive_connections=max_connections)
+            async with httpx.AsyncClient(limits=limits, http2=_HTTP2, timeout=10,
+                                         headers=headers) as client:
+                return await asyncio.gather(*(fetch(client, item) for item in items),
+                                            return_exceptions=True)
+        
+        return asyncio.run(gather())
+    
+    async def _aget(self, client, url: str, headers: Optional[Dict] = None):
+        """
+        client.get with the session's retry policy: rate limits, 5xx responses and
+        connection errors are retried with exponential backoff (honouring Retry-After).
+        """
+        for attempt in range(_RETRY_TOTAL + 1):
+            delay = _RETRY_BACKOFF * 2 ** attempt
+            try:
+                response = await client.get(url, headers=headers)
+            except httpx.TransportError:
+                if attempt == _RETRY_TOTAL:
+                    raise
+            else:
+                if response.status_code not in _RETRY_STATUSES or attempt == _RETRY_TOTAL:
+                    return response
+                retry_after = response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    delay = max(delay, int(retry_after))
+            await asyncio.sleep(delay)
+    
+    async def _afetch_team_roster(self, client, team_abbr: str, season: str, cache_file: str) -> Tuple:
+        """Fetches one roster with an httpx.AsyncClient; returns (data, response) like _get_json."""
+        url = f"{self.base_url}/roster/{team_abbr}/{season}"
+        response = await self._aget(client, url, headers=self._validator_headers(cache_file))
+        if response.status_code == 304:
+            cached = self._revalidated_cache(cache_file)
+            if cached is not None:
+                return cached, None
+            response = await self._aget(client, url)
+        response.raise_for_status()
+        return _json_loads(response.content), response
+    
+    def _fetch_rosters(self, team_abbrs: List[str], season: Optional[str] = None) -> Dict[str, List[Dict]]:
+        """
+        Fetches rosters for many teams at once.
+        Cached rosters are read from disk in a thread pool; the rest are requested
+        concurrently over one HTTP/2 connection when httpx is installed (and no event
+        loop is running), otherwise through the same thread pool over the pooled session.
+        
+        Args:
+            team_abbrs: Team abbreviations to fetch
+            season: Season in format YYYYYYYY, defaults to current
+            
+        Returns:
+            Dictionary mapping team abbreviation to roster data
+        """
+        if season is None:
+            season = self.current_season
+        
+        use_async = self._can_fetch_async()
+        local = []
+        missing = []
+        cache_files = {}
+        for team_abbr in team_abbrs:
+            cache_file = cache_files[team_abbr] = os.path.join(self.cache_dir, f"roster_{team_abbr}_{season}.json")
+            if not use_async or self._cache_is_valid(cache_file):
+                local.append(team_abbr)
+            else:
+                missing.append(team_abbr)
+        
+        # Cache reads (and, without the httpx path, session fetches) overlap in a thread pool
+        with ThreadPoolExecutor(max_workers=_ROSTER_WORKERS) as executor:
+            rosters = dict(zip(local, executor.map(
+                lambda team_abbr: self.fetch_team_roster(team_abbr, season), local
+            )))
+        
+        if not missing:
+            return rosters
+        
+        print(f"Fetching {len(missing)} rosters concurrently...")
+        fetched = self._gather_async(
+            lambda client, team_abbr: self._afetch_team_roster(client, team_abbr, season,
+                                                               cache_files[team_abbr]),
+            missing, _ROSTER_WORKERS
+        )
+        for team_abbr, result in zip(missing, fetched):
+            if isinstance(result, Exception):
+                print(f"Error fetching roster for {team_abbr} ({season}): {result}")
+                rosters[team_abbr] = []
+                continue
+            
+            # Save to cache (unless the server reported the cached roster unchanged)
+            roster_data, response = result
+            if response is not None:
+                self._save_cache(roster_data, cache_files[team_abbr], response)
+            rosters[team_abbr] = roster_data
+        
+        return rosters
+    
     def fetch_player_stats(self, player_id: int, include_previous=True) -> Dict:
         """
         Fetches detailed statistics for a specific player.
@@ -287,75 +777,136 @@ class NHLDataFetcher:
         
         if self._cache_is_valid(cache_file):
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
-                    # Return the simplified version if it exists
-                    if 'current_season' in cached_data:
-                        return cached_data
-                    # Otherwise process the cached raw data
-                    return self._extract_current_season_stats(cached_data)
+                cached_data = self._load_cache(cache_file)
+                # Return the simplified version if it exists
+                if 'current_season' in cached_data:
+                    return cached_data
+                # Otherwise process the cached raw data
+                return self._extract_current_season_stats(cached_data, include_previous)
             except Exception:
                 pass
             
         try:
             # Fetch player landing page which contains career stats
             url = f"{self.base_url}/player/{player_id}/landing"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            player_data = response.json()
+            player_data, response = self._get_json(url, cache_file)
+            if response is None and 'current_season' in player_data:
+                return player_data  # Unchanged, this is the cached simplified version
             
             # Extract and simplify current season stats
-            simplified_data = self._extract_current_season_stats(player_data)
+            simplified_data = self._extract_current_season_stats(player_data, include_previous)
             
             # Save simplified version to cache
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(simplified_data, f, ensure_ascii=False, indent=2)
+            self._save_cache(simplified_data, cache_file, response)
                 
             return simplified_data
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Error fetching stats for player {player_id}: {e}")
             return {}
     
-    def _extract_current_season_stats(self, player_data: Dict) -> Dict:
+    def fetch_player_landings(self, player_ids: List[int]) -> Dict[int, object]:
+        """
+        Fetches the raw player landing documents (featuredStats, seasonTotals,
+        careerTotals, ...) for many players at once.
+        Cached landing documents are used whatever their age. A cache file holding
+        fetch_player_stats' simplified stats (same path, no featuredStats or
+        seasonTotals) counts as missing; those and the rest are requested
+        concurrently, over HTTP/2 with httpx when installed (and no event loop is
+        running), otherwise through a thread pool over the pooled session, and then cached.
+        
+        Args:
+            player_ids: NHL player ID numbers
+            
+        Returns:
+            Dictionary mapping player ID to its landing data, or to the exception
+            that kept it from being fetched
+        """
+        landings = {}
+        missing = []
+        for player_id in dict.fromkeys(player_ids):
+            cache_file = os.path.join(self.cache_dir, f"player_{player_id}.json")
+            data = None
+            if os.path.exists(cache_file):
+                try:
+                    data = self._load_cache(cache_file)
+                except Exception:
+                    pass
+            # Only a raw landing document will do, not the simplified stats
+            if isinstance(data, dict) and ('featuredStats' in data or 'seasonTotals' in data):
+                landings[player_id] = data
+            else:
+                missing.append(player_id)
+        
+        if not missing:
+            return landings
+        
+        print(f"Fetching {len(missing)} player pages concurrently...")
+        if self._can_fetch_async():
+            fetched = self._gather_async(self._afetch_player_landing, missing, _PLAYER_WORKERS)
+        else:
+            with ThreadPoolExecutor(max_workers=_PLAYER_WORKERS) as executor:
+                fetched = list(executor.map(self._fetch_player_landing, missing))
+        
+        for player_id, data in zip(missing, fetched):
+            if not isinstance(data, Exception):
+                # Save to cache
+                self._save_cache(data, os.path.join(self.cache_dir, f"player_{player_id}.json"))
+            landings[player_id] = data
+        
+        return landings
+    
+    def _fetch_player_landing(self, player_id: int):
+        """Fetches one landing document over the session; errors are returned, not raised."""
+        try:
+            response = self.session.get(f"{self.base_url}/player/{player_id}/landing", timeout=10)
+            response.raise_for_status()
+            return _json_loads(response.content)
+        except Exception as e:
+            return e
+    
+    async def _afetch_player_landing(self, client, player_id: int):
+        """Fetches one landing document with an httpx.AsyncClient (no caching)."""
+        response = await self._aget(client, f"{self.base_url}/player/{player_id}/landing")
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
+    def _extract_current_season_stats(self, player_data: Dict, include_previous: bool = True) -> Dict:
         """
         Extract and flatten current season statistics from complex API response.
         
         Args:
             player_data: Raw player data from API
+            include_previous: Whether to also add previous season stats
             
         Returns:
-            Simplified dictionary with current season stats
-        """
-        current_season = self.current_season
-        current_stats = {}
-        
-        # Try to get from featuredStats first (most recent data)
-        if 'featuredStats' in player_data:
-            featured = player_data['featuredStats']
-            if 'regularSeason' in featured:
-                reg_season = featured['regularSeason']
-                if 'subSeason' in reg_season:
-                    current_stats = reg_season['subSeason']
-        
-        # If not found, look in seasonTotals array
-        if not current_stats and 'seasonTotals' in player_data:
-            for season_data in player_data['seasonTotals']:
-                if (season_data.get('season') == current_season and 
-                    season_data.get('leagueAbbrev') == 'NHL' and
-                    season_data.get('gameTypeId') == 2):  # Regular season
-                    current_stats = season_data
-                    break
+            Simplified dictionary with current (and previous) season stats
+        """
+        # NHL regular season totals keyed by season id in one pass;
+        # the first entry wins if a traded player has one row per team
+        by_season = {}
+        for season_data in player_data.get('seasonTotals', []):
+            if season_data.get('leagueAbbrev') == 'NHL' and season_data.get('gameTypeId') == 2:
+                by_season.setdefault(season_data.get('season'), season_data)
+        
+        # Try to get from featuredStats first (most recent data),
+        # otherwise fall back to seasonTotals
+        current_stats = player_data.get('featuredStats', {}).get('regularSeason', {}).get('subSeason')
+        if not current_stats:
+            current_stats = by_season.get(self.current_season_id, {})
         
         # Build simplified result
         result = {
-            'current_season': current_stats if current_stats else {},
+            'current_season': current_stats,
             'playerId': player_data.get('playerId'),
             'position': player_data.get('position'),
             'currentTeamAbbrev': player_data.get('currentTeamAbbrev'),
-            'fullName': f"{player_data.get('firstName', {}).get('default', '')} {player_data.get('lastName', {}).get('default', '')}".strip()
+            'fullName': f"{_unwrap(player_data.get('firstName'))} {_unwrap(player_data.get('lastName'))}".strip()
         }
         
+        if include_previous:
+            result['previous_season'] = by_season.get(self.previous_season_id, {})
+        
         return result
 
     def fetch_all_players(self) -> List[Dict]:
@@ -370,14 +921,15 @@ class NHLDataFetcher:
         teams = self.fetch_all_teams()
         
         print(f"Fetching player data for {len(teams)} teams...")
+        rosters = self._fetch_rosters([team.get('abbrev') for team in teams if team.get('abbrev')])
         
         for i, team in enumerate(teams):
             team_abbr = team.get('abbrev')
             if not team_abbr:
                 continue
                 
-            print(f"[{i+1}/{len(teams)}] Fetching roster for {team_abbr}...")
-            roster = self.fetch_team_roster(team_abbr)
+            print(f"[{i+1}/{len(teams)}] Processing roster for {team_abbr}...")
+            roster = rosters.get(team_abbr, [])
             
             # Handle different roster formats
             roster_players = []
@@ -392,19 +944,20 @@ class NHLDataFetcher:
             
             # Process each player
             for player in roster_players:
-                player_id = player.get('id')
+                get = player.get
+                player_id = get('id')
                 if not player_id:
                     continue
                 
                 # Build simplified player object
                 player_obj = {
                     'id': player_id,
-                    'name': player.get('name', {}).get('default', '') if isinstance(player.get('name'), dict) else player.get('name', ''),
-                    'firstName': player.get('firstName', {}).get('default', '') if isinstance(player.get('firstName'), dict) else player.get('firstName', ''),
-                    'lastName': player.get('lastName', {}).get('default', '') if isinstance(player.get('lastName'), dict) else player.get('lastName', ''),
-                    'position': player.get('positionCode', player.get('position', 'F')),
+                    'name': _unwrap(get('name')),
+                    'firstName': _unwrap(get('firstName')),
+                    'lastName': _unwrap(get('lastName')),
+                    'position': get('positionCode', get('position', 'F')),
                     'team': team_abbr,
-                    'sweaterNumber': player.get('sweaterNumber', player.get('jerseyNumber', ''))
+                    'sweaterNumber': get('sweaterNumber', get('jerseyNumber', ''))
                 }
                 
                 all_players.append(player_obj)
@@ -426,14 +979,46 @@ class NHLDataFetcher:
             True if successful, False otherwise
         """
         try:
-            with open(filepath, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=2, ensure_ascii=False)
+            _json_dump(data, filepath)
             print(f"Successfully saved data to {filepath}")
             return True
         except Exception as e:
             print(f"Error saving to JSON: {e}")
             return False
     
+    def load_from_json(self, filepath: str) -> List[Dict]:
+        """
+        Loads player data from a JSON file, either a list of players or an
+        object with a "players" list (as written by save_to_json).
+        Files over 50 MB are streamed one player at a time with ijson.
+        
+        Args:
+            filepath: Input file path
+            
+        Returns:
+            List of player dictionaries
+        """
+        try:
+            if ijson is not None and os.path.getsize(filepath) > _JSON_STREAM_THRESHOLD:
+                with open(filepath, 'rb') as file:
+                    # Peek at the outer structure to pick the item prefix
+                    head = file.read(64).lstrip()
+                    file.seek(0)
+                    prefix = 'item' if head.startswith(b'[') else 'players.item'
+                    players = list(ijson.items(file, prefix, use_float=True))
+            else:
+                data = _json_load(filepath)
+                players = data if isinstance(data, list) else data.get('players', [])
+        except FileNotFoundError:
+            print(f"❌ Error: File {filepath} not found")
+            return []
+        except Exception as e:
+            print(f"❌ Error loading JSON: {e}")
+            return []
+        
+        print(f"✓ Loaded {len(players)} players from {filepath}")
+        return players
+    
     def save_to_csv(self, data: List[Dict], filepath: str) -> bool:
         """
         Saves player data to a CSV file.
@@ -451,21 +1036,50 @@ class NHLDataFetcher:
             
         try:
             with open(filepath, 'w', newline='', encoding='utf-8') as file:
-                # Get all unique keys from all dictionaries
-                fieldnames = set()
-                for player in data:
-                    fieldnames.update(player.keys())
-                fieldnames = sorted(list(fieldnames))
+                # All unique keys in first-seen order (dicts keep insertion order)
+                fieldnames = list(dict.fromkeys(key for player in data for key in player))
                 
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(data)
+                # Plain rows in header order: DictWriter would also re-check every
+                # row's keys against the header, which the union above makes moot
+                writer = csv.writer(file)
+                writer.writerow(fieldnames)
+                writer.writerows([player.get(key, '') for key in fieldnames] for player in data)
             print(f"Successfully saved data to {filepath}")
             return True
         except Exception as e:
             print(f"Error saving to CSV: {e}")
             return False
     
+    def load_from_csv(self, filepath: str) -> List[Dict]:
+        """
+        Loads player data from a CSV file, e.g. one written by save_to_csv.
+        The file is parsed column-wise by pandas, so numeric columns such as
+        the 'cena' price are converted in one pass instead of per row.
+        
+        Args:
+            filepath: Input file path
+            
+        Returns:
+            List of player dictionaries (empty cells are left out, so e.g. a player
+            saved without a price falls back to .get('cena', 0))
+        """
+        import pandas as pd
+        
+        try:
+            df = pd.read_csv(filepath, encoding='utf-8-sig', dtype=_CSV_DTYPES)
+        except FileNotFoundError:
+            print(f"❌ Error: File {filepath} not found")
+            return []
+        except Exception as e:
+            print(f"❌ Error loading CSV: {e}")
+            return []
+        
+        records = df.astype(object).where(df.notna(), None).to_dict(orient='records')
+        players = [{key: value for key, value in record.items() if value is not None}
+                   for record in records]
+        print(f"✓ Loaded {len(players)} players from {filepath}")
+        return players
+    
     def parse_price_csv(self, filepath: str, debug: bool = False) -> Dict[str, float]:
         """
         Robust CSV price parser.
@@ -478,72 +1092,55 @@ class NHLDataFetcher:
         """
         player_prices = {}
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                content = file.read()
-                # Remove BOM if present
-                if content.startswith('\ufeff'):
-                    content = content[1:]
-                lines = [ln for ln in content.splitlines() if ln.strip()]
-                reader = csv.reader(lines)
+            # utf-8-sig drops a BOM if present; rows are streamed straight from the file
+            with open(filepath, 'r', encoding='utf-8-sig', newline='') as file:
+                reader = csv.reader(file)
                 row_count = 0
-                price_format_detected = None
+                parse_price = None
 
-                # Debug info for price entries
-                parsed_entries = []
+                # Price per parsed name for the summary and the debug file
+                # (last row wins, like player_prices)
+                parsed_entries = {}
+                # Skipped rows are reported once after the loop instead of printed per row
+                skipped_rows = []
                 
                 for row in reader:
+                    if not row:
+                        continue  # Blank line
                     row_count += 1
-                    if not row or not row[0].strip():
+                    if not row[0].strip():
                         continue
                         
                     # Skip header-like rows
                     first_cell = row[0].strip().lower()
-                    if any(h in first_cell for h in ['hráč', 'player', 'name', 'cena', 'price']):
+                    if _HEADER_RE.search(first_cell):
                         if debug:
-                            print(f"Skipping header row: {row}")
+                            skipped_rows.append(f"header row: {row}")
                         continue
                     # Skip comment lines
-                    if first_cell.startswith('//') or first_cell.startswith('#'):
+                    if first_cell.startswith(('//', '#')):
                         if debug:
-                            print(f"Skipping comment row: {row}")
+                            skipped_rows.append(f"comment row: {row}")
                         continue
 
-                    name = row[0].strip()
-                    price = None
-
-                    # Auto-detect price format if we haven't already
-                    if price_format_detected is None and len(row) >= 2:
-                        # Check if using "30,9" comma format (3 columns: Name, Whole, Decimal)
-                        if len(row) >= 3 and re.match(r'^\d+$', row[1].strip()) and re.match(r'^\d+$', row[2].strip()):
-                            price_format_detected = "split_decimal"
-                        # Check if using "30.9" or "30,9" format in a single cell (2 columns: Name, Price)
-                        elif re.match(r'^[\d\.\,]+$', row[1].strip()):
-                            price_format_detected = "single_cell"
-                        
-                        if debug and price_format_detected:
-                            print(f"✓ Detected price format: {price_format_detected}")
+                    # Composed (NFC) form, like the API's names, so that a file saved
+                    # with decomposed accents still hits the direct lookups
+                    name = unicodedata.normalize('NFC', row[0].strip())
 
-                    # Try formats:
-                    # 1) Name, whole, decimal  -> ["Makar C.", "30", "9"] = 30.9
-                    if (price_format_detected == "split_decimal" or price_format_detected is None) and \
-                       len(row) >= 3 and re.match(r'^\d+$', row[1].strip()) and re.match(r'^\d+$', row[2].strip()):
-                        try:
-                            price = float(f"{row[1].strip()}.{row[2].strip()}")
-                        except Exception:
-                            price = None
-                    # 2) Name, price_with_comma_or_dot -> ["Connor McDavid", "14,5"] or ["Name","14.5"]
-                    elif (price_format_detected == "single_cell" or price_format_detected is None) and len(row) >= 2:
-                        price_str = row[1].strip().replace(',', '.')
-                        # Remove any non-digit except dot
-                        price_str = re.sub(r'[^\d\.]', '', price_str)
-                        try:
-                            price = float(price_str)
-                        except Exception:
-                            price = None
+                    # Sniff the price format on the first data row, then parse
+                    # every row with that format's parser only
+                    if parse_price is None and len(row) >= 2:
+                        price_format_detected = _detect_price_format(row)
+                        if price_format_detected:
+                            parse_price = _PRICE_PARSERS[price_format_detected]
+                            if debug:
+                                print(f"✓ Detected price format: {price_format_detected}")
+
+                    price = (parse_price or _parse_any_price)(row)
 
                     if price is None:
                         if debug:
-                            print(f"⚠️  Could not parse price on row {row_count}: {row}")
+                            skipped_rows.append(f"unparsable price on row {row_count}: {row}")
                         continue
 
                     # Store player name and price only - no fantasy points
@@ -554,22 +1151,29 @@ class NHLDataFetcher:
                     # Generate additional name variants for better matching
                     variants = self._generate_name_variants(name)
                     for variant in variants:
-                        if variant not in player_prices:
-                            player_prices[variant] = price
+                        player_prices.setdefault(variant, price)
                     
-                    parsed_entries.append({"name": name, "price": price})
+                    parsed_entries[name] = price
                     
                     if debug and row_count <= 5:
                         print(f"✓ Parsed: {name} = ${price}M (variants: {len(variants)})")
 
-            # Save parsed data for debugging
-            debug_file = filepath.replace('.csv', '_parsed.json').replace('.txt', '_parsed.json')
-            with open(debug_file, 'w', encoding='utf-8') as f:
-                json.dump(parsed_entries, f, ensure_ascii=False, indent=2)
+                if debug and skipped_rows:
+                    print(f"⚠️  Skipped {len(skipped_rows)} rows. First 10:")
+                    for message in skipped_rows[:10]:
+                        print(f"    - {message}")
 
             print(f"\n✓ Processed {len(parsed_entries)} unique player prices from {filepath}")
             print(f"✓ Created {len(player_prices)} total name variants for matching")
-            print(f"✓ Debug file saved: {debug_file}")
+
+            if debug:
+                # Save parsed data for debugging
+                # hraci_ceny.csv -> hraci_ceny_parsed.json, next to the price file
+                source = Path(filepath)
+                debug_file = source.with_name(f"{source.stem}_parsed.json")
+                _json_dump([{"name": name, "price": price} for name, price in parsed_entries.items()],
+                           debug_file)
+                print(f"✓ Debug file saved: {debug_file}")
             
             return player_prices
 
@@ -583,66 +1187,16 @@ class NHLDataFetcher:
             return {}
 
     def _normalize_name(self, name: str) -> str:
-        """Return a normalized name for comparison."""
-        if not name:
-            return ''
-        # Normalize unicode, remove diacritics
-        name = unicodedata.normalize('NFKD', name)
-        name = ''.join(ch for ch in name if not unicodedata.combining(ch))
-        # Lowercase, remove special chars, keep alphanumerics and spaces
-        name = name.lower().replace('.', ' ').replace(',', ' ')
-        name = re.sub(r'[^a-z0-9\s]', '', name)
-        name = re.sub(r'\s+', ' ', name).strip()
-        return name
+        """Return a normalized name for comparison (memoized per name)."""
+        return _normalize_name_cached(name)
 
-    def _generate_name_variants(self, name: str) -> List[str]:
+    def _generate_name_variants(self, name: str) -> Tuple[str, ...]:
         """
         Generate multiple variants of a player name for flexible matching
-        Includes handling for common NHL name formats
+        Includes handling for common NHL name formats, most specific first (memoized per name;
+        the cached tuple itself is returned, without a copy)
         """
-        variants = set()
-        
-        # Original name is always included
-        if name:
-            variants.add(name.lower())
-            
-        # Normalize the name for basic processing
-        norm_name = self._normalize_name(name)
-        if norm_name and norm_name != name.lower():
-            variants.add(norm_name)
-            
-        # Split into tokens for additional processing
-        tokens = norm_name.split() if norm_name else []
-        
-        if len(tokens) >= 2:
-            # Last name + first initial (common format)
-            variants.add(f"{tokens[-1]} {tokens[0][0]}")
-            
-            # First initial + last name
-            variants.add(f"{tokens[0][0]} {tokens[-1]}")
-            
-            # Last name only
-            variants.add(tokens[-1])
-            
-            # First name only
-            variants.add(tokens[0])
-            
-            # First name + last name initial
-            variants.add(f"{tokens[0]} {tokens[-1][0]}")
-            
-            # Common hockey format: Last name + first initial
-            variants.add(f"{tokens[-1]} {tokens[0][0]}")
-            
-            # Last name + First initial with dot (Makar C.) - THIS IS THE PREFERRED FORMAT
-            variants.add(f"{tokens[-1]} {tokens[0][0]}.")
-            
-        # Try with different spaces/formats
-        for v in list(variants):
-            variants.add(v.replace(' ', ''))  # No spaces
-            variants.add(v.replace(' ', '.'))  # Dots instead of spaces
-            
-        # Return filtered list without empty strings
-        return list(v for v in variants if v)
+        return _name_variants_cached(name)
 
     def _extract_player_name(self, player: Dict, name_key: str = 'name') -> str:
         """Extract player name from dictionary with fallbacks and convert to price file format."""
@@ -697,38 +1251,95 @@ class NHLDataFetcher:
 
     def create_common_player_mappings(self) -> Dict[str, str]:
         """
-        Create a mapping for common NHL stars with different name formats
+        Return the mapping for common NHL stars with different name formats
         Maps standard name formats to the formats typically used in the price file
         """
-        # Map common NHL star names to their likely price file format
-        common_mappings = {
-            "connor mcdavid": "mcdavid c.",
-            "cale makar": "makar c.",
-            "auston matthews": "matthews a.",
-            "david pastrnak": "pastrňák d.",
-            "kirill kaprizov": "kaprizov k.",
-            "nathan mackinnon": "mackinnon n.",
-            "tage thompson": "thompson t.",
-            "nikita kucherov": "kucherov n.",
-            "alexander ovechkin": "ovechkin a.",
-            "brady tkachuk": "tkachuk b.",
-            "matthew tkachuk": "tkachuk m.",
-            "leon draisaitl": "draisaitl l.",
-            "mitch marner": "marner m.",
-            "quinn hughes": "hughes q.",
-            "jack hughes": "hughes j.",
-            "luke hughes": "hughes l.",
-            "sidney crosby": "crosby s.",
-            "steven stamkos": "stamkos s.",
-            "elias pettersson": "pettersson e.",
-            "mark scheifele": "scheifele m.",
-            "sebastian aho": "aho s.",
-            "patrik laine": "laine p.",
-            "aleksander barkov": "barkov a.",
-            "brad marchand": "marchand b.",
-        }
-        return common_mappings
+        return dict(COMMON_PLAYER_MAP)
 
+    def _best_fuzzy_match(
+        self, name: str, candidates: List[str], candidate_lengths: Optional[List[int]] = None
+    ) -> Tuple[Optional[str], float]:
+        """
+        Find the candidate most similar to name, if it scores strictly above the fuzzy cutoff.
+        Uses RapidFuzz's C++ ratio when installed, otherwise difflib's SequenceMatcher.
+        Both score 2 * matches / total length (returned here as 0.0-1.0), but RapidFuzz
+        counts matches by Indel alignment and difflib by matching blocks, so a few
+        pairs score differently depending on which one is installed.
+        
+        Returns:
+            Tuple of (best candidate or None, similarity ratio)
+        """
+        if rf_process is not None:
+            result = rf_process.extractOne(name, candidates, scorer=fuzz.ratio,
+                                           score_cutoff=_FUZZY_SCORE_CUTOFF)
+            # score_cutoff is inclusive; like the difflib scan, a score of exactly
+            # the cutoff is not a match
+            if result is None or result[1] <= _FUZZY_SCORE_CUTOFF:
+                return None, 0.0
+            return result[0], result[1] / 100.0
+        
+        import difflib  # Only needed without rapidfuzz
+        
+        if candidate_lengths is None:
+            candidate_lengths = [len(candidate) for candidate in candidates]
+        name_length = len(name)
+        
+        best_match = None
+        best_ratio = _FUZZY_SCORE_CUTOFF / 100.0
+        for candidate, length in zip(candidates, candidate_lengths):
+            # ratio() can't exceed 2 * shorter / total length; skip candidates whose
+            # lengths alone rule out beating the current best before building a matcher
+            if 2.0 * min(name_length, length) / (name_length + length) <= best_ratio:
+                continue
+            matcher = difflib.SequenceMatcher(None, name, candidate)
+            if matcher.quick_ratio() <= best_ratio:
+                continue
+            ratio = matcher.ratio()
+            if ratio > best_ratio:
+                best_ratio = ratio
+                best_match = candidate
+                # Short names only get here when identical (a ratio in [0.99, 1.0)
+                # needs 100+ characters between the two), so stop searching
+                if ratio >= 0.99:
+                    break
+        
+        if best_match is None:
+            return None, 0.0
+        return best_match, best_ratio
+    
+    def _best_fuzzy_matches(
+        self, names: List[str], candidates: List[str]
+    ) -> List[Tuple[Optional[str], float]]:
+        """
+        _best_fuzzy_match for many names at once. With RapidFuzz all pairs are
+        scored in one multi-threaded cdist call per block of names.
+        A name that occurs several times is only scored once.
+        """
+        unique_names = list(dict.fromkeys(names))
+        
+        if rf_process is None or not unique_names or not candidates:
+            candidate_lengths = [len(candidate) for candidate in candidates]
+            results = [self._best_fuzzy_match(name, candidates, candidate_lengths)
+                       for name in unique_names]
+        else:
+            results = []
+            for start in range(0, len(unique_names), _FUZZY_BLOCK_ROWS):
+                block = unique_names[start:start + _FUZZY_BLOCK_ROWS]
+                # Scores below the cutoff come back as 0
+                scores = rf_process.cdist(block, candidates, scorer=fuzz.ratio,
+                                          score_cutoff=_FUZZY_SCORE_CUTOFF, workers=-1)
+                best = scores.argmax(axis=1)
+                for row, col in enumerate(best.tolist()):
+                    score = float(scores[row, col])
+                    # Strictly above the cutoff, like _best_fuzzy_match
+                    results.append((candidates[col], score / 100.0) if score > _FUZZY_SCORE_CUTOFF
+                                   else (None, 0.0))
+        
+        if len(unique_names) == len(names):
+            return results
+        best_by_name = dict(zip(unique_names, results))
+        return [best_by_name[name] for name in names]
+    
     def match_players_with_prices(
         self,
         players: List[Dict],
@@ -744,7 +1355,7 @@ class NHLDataFetcher:
             players: List of player dictionaries
             prices: Dictionary mapping player names to prices
             name_key: Key in player dict containing the name
-            debug_output: Whether to print detailed debug info
+            debug_output: Whether to print detailed debug info and save player_price_matching.json
             
         Returns:
             List of players with prices added
@@ -756,23 +1367,28 @@ class NHLDataFetcher:
         fuzzy_matches = 0
         unmatched_players = []
         
-        # Store match details for debugging
+        # Store match details for debugging (only collected and saved with debug_output)
         match_details = []
         
         # Create mapping for common NHL stars
-        common_player_map = self.create_common_player_mappings()
+        common_player_map = _COMMON_PLAYER_MAP_NORMALIZED
         
         # First pass: Build efficient lookup structures
         # 1. Normalize all price names for faster lookups
+        #    Lowercased names live in their own dict for the case-insensitive
+        #    check, so they don't double the keys scanned by fuzzy matching
         norm_prices = {}
+        lower_prices = {}
         for price_name, price in prices.items():
             # Store original to normalized mapping
             norm_name = self._normalize_name(price_name)
             if norm_name:
                 norm_prices[norm_name] = price
-                
-            # Store lowercase version
-            norm_prices[price_name.lower()] = price
+            lower_prices[price_name.lower()] = price
+        
+        # Candidate names for fuzzy matching, and the players still waiting for one
+        price_keys = list(norm_prices)
+        fuzzy_pending = []
         
         # Process each player
         for player in players:
@@ -798,32 +1414,35 @@ class NHLDataFetcher:
                 match_type = "direct"
                 matched_variant = player_name
                 matched_price = prices[player_name]
-                match_details.append({
-                    "player": player_name,
-                    "match_type": "direct",
-                    "matched_with": player_name,
-                    "price": prices[player_name]
-                })
+                if debug_output:
+                    match_details.append({
+                        "player": player_name,
+                        "match_type": "direct",
+                        "matched_with": player_name,
+                        "price": prices[player_name]
+                    })
                 continue
             
             # STRATEGY 2: Case-insensitive match
-            if player_name.lower() in prices:
-                player['cena'] = prices[player_name.lower()]
+            lower_name = player_name.lower()
+            if lower_name in lower_prices:
+                player['cena'] = lower_prices[lower_name]
                 matched_count += 1
                 direct_matches += 1
                 match_type = "case_insensitive"
-                matched_variant = player_name.lower()
-                matched_price = prices[player_name.lower()]
-                match_details.append({
-                    "player": player_name,
-                    "match_type": "case_insensitive",
-                    "matched_with": player_name.lower(),
-                    "price": prices[player_name.lower()]
-                })
+                matched_variant = lower_name
+                matched_price = lower_prices[lower_name]
+                if debug_output:
+                    match_details.append({
+                        "player": player_name,
+                        "match_type": "case_insensitive",
+                        "matched_with": lower_name,
+                        "price": lower_prices[lower_name]
+                    })
                 continue
                 
             # STRATEGY 3: Try common player mappings for NHL stars
-            norm_player_name = self._normalize_name(player_name).lower()
+            norm_player_name = self._normalize_name(player_name)
             if norm_player_name in common_player_map:
                 mapped_name = common_player_map[norm_player_name]
                 if mapped_name in norm_prices:
@@ -833,80 +1452,77 @@ class NHLDataFetcher:
                     match_type = "common_map"
                     matched_variant = mapped_name
                     matched_price = norm_prices[mapped_name]
-                    match_details.append({
-                        "player": player_name,
-                        "match_type": "common_map",
-                        "mapped_to": mapped_name,
-                        "price": norm_prices[mapped_name]
-                    })
+                    if debug_output:
+                        match_details.append({
+                            "player": player_name,
+                            "match_type": "common_map",
+                            "mapped_to": mapped_name,
+                            "price": norm_prices[mapped_name]
+                        })
                     continue
         
-            # STRATEGY 4: Try all name variants
+            # STRATEGY 4: First of the player's name variants with a price. No need
+            # to expand the price side too: parse_price_csv already stored every
+            # variant of every price name
             name_variants = self._generate_name_variants(player_name)
-            variant_matched = False
+            variant = next((v for v in name_variants if v in norm_prices), None)
             
-            for variant in name_variants:
-                if variant in norm_prices:
-                    player['cena'] = norm_prices[variant]
-                    matched_count += 1
-                    variant_matches += 1
-                    variant_matched = True
-                    match_type = "variant"
-                    matched_variant = variant
-                    matched_price = norm_prices[variant]
+            if variant is not None:
+                player['cena'] = norm_prices[variant]
+                matched_count += 1
+                variant_matches += 1
+                match_type = "variant"
+                matched_variant = variant
+                matched_price = norm_prices[variant]
+                if debug_output:
                     match_details.append({
                         "player": player_name,
                         "match_type": "variant",
                         "matched_variant": variant,
                         "price": norm_prices[variant]
                     })
-                    break
-                    
-            if variant_matched:
                 continue
                 
-            # STRATEGY 5: Try fuzzy matching as last resort
-            best_match = None
-            best_ratio = 0.0
-            
-            for price_name in norm_prices.keys():
-                ratio = difflib.SequenceMatcher(None, norm_player_name, price_name).ratio()
-                if ratio > best_ratio:
-                    best_ratio = ratio
-                    best_match = price_name
-            
+            # STRATEGY 5: Fuzzy matching as last resort, scored for all remaining
+            # players at once after this loop
+            fuzzy_pending.append((player, player_name, norm_player_name, name_variants, len(match_details)))
+            if debug_output:
+                match_details.append(None)  # Filled in below, keeps the player order
+        
+        fuzzy_results = self._best_fuzzy_matches([pending[2] for pending in fuzzy_pending], price_keys)
+        for (player, player_name, _, name_variants, detail_index), (best_match, best_ratio) in zip(
+                fuzzy_pending, fuzzy_results):
             # Accept fuzzy match if confidence is high enough (>75% to be more lenient)
             if best_match and best_ratio > 0.75:
                 player['cena'] = norm_prices[best_match]
                 matched_count += 1
                 fuzzy_matches += 1
-                match_type = "fuzzy"
-                matched_variant = best_match
-                matched_price = norm_prices[best_match]
-                match_details.append({
-                    "player": player_name,
-                    "match_type": "fuzzy",
-                    "matched_with": best_match,
-                    "confidence": best_ratio,
-                    "price": norm_prices[best_match]
-                })
+                if debug_output:
+                    match_details[detail_index] = {
+                        "player": player_name,
+                        "match_type": "fuzzy",
+                        "matched_with": best_match,
+                        "confidence": best_ratio,
+                        "price": norm_prices[best_match]
+                    }
                 continue
             
             # No match found - collect for reporting
             unmatched_players.append(player_name)
-            match_details.append({
-                "player": player_name,
-                "match_type": "unmatched",
-                "variants_tried": name_variants[:3],
-                "original_name": player.get(name_key, ''),
-                "api_first_name": player.get('firstName', {}).get('default', '') if isinstance(player.get('firstName'), dict) else '',
-                "api_last_name": player.get('lastName', {}).get('default', '') if isinstance(player.get('lastName'), dict) else ''
-            })
+            if debug_output:
+                match_details[detail_index] = {
+                    "player": player_name,
+                    "match_type": "unmatched",
+                    "variants_tried": name_variants[:3],
+                    "original_name": player.get(name_key, ''),
+                    "api_first_name": player.get('firstName', {}).get('default', '') if isinstance(player.get('firstName'), dict) else '',
+                    "api_last_name": player.get('lastName', {}).get('default', '') if isinstance(player.get('lastName'), dict) else ''
+                }
         
         # Save match details to file for debugging
-        try:
-            with open("player_price_matching.json", "w", encoding="utf-8") as f:
-                json.dump({
+        if debug_output:
+            try:
+                _json_dump({
                     "total_players": len(players),
                     "matched_count": matched_count,
                     "direct_matches": direct_matches,
@@ -915,9 +1531,8 @@ class NHLDataFetcher:
                     "fuzzy_matches": fuzzy_matches,
                     "unmatched_count": len(unmatched_players),
                     "details": match_details
-                }, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            if debug_output:
+                }, "player_price_matching.json")
+            except Exception as e:
                 print(f"Warning: Could not save match details: {e}")
         
         # Print match statistics
@@ -949,18 +1564,17 @@ class NHLDataFetcher:
         
         if self._cache_is_valid(cache_file, max_age_hours=6):
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return self._load_cache(cache_file)
             except Exception:
                 pass
         
         try:
             url = f"{self.base_url}/schedule/{date}"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            schedule_data = response.json()
+            schedule_data, response = self._get_json(url, cache_file)
+            if response is None:
+                return schedule_data  # Unchanged, this is the cached result
             
-            teams_playing = []
+            teams_playing = set()
             
             # Extract teams from game data
             for game_week in schedule_data.get('gameWeek', []):
@@ -969,21 +1583,39 @@ class NHLDataFetcher:
                     home_team = game.get('homeTeam', {}).get('abbrev')
                     
                     if away_team:
-                        teams_playing.append(away_team)
+                        teams_playing.add(away_team)
                     if home_team:
-                        teams_playing.append(home_team)
+                        teams_playing.add(home_team)
             
-            result = {date: list(set(teams_playing))}
+            # Sorted so the result and the cache file are the same on every fetch
+            result = {date: sorted(teams_playing)}
             
-            # Save to cache
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
+            # Save to cache, with the validators for the next conditional GET
+            self._save_cache(result, cache_file, response)
             
             return result
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Error fetching schedule for {date}: {e}")
             return {date: []}
     
+    def get_team_schedules(self, dates: List[str]) -> Dict[str, List[str]]:
+        """
+        Get teams playing on several dates at once.
+        Each date goes through get_team_schedule (cache included); the requests
+        run concurrently over the pooled session.
+        
+        Args:
+            dates: Dates in YYYY-MM-DD format
+            
+        Returns:
+            Dictionary mapping each date to its list of team abbreviations
+        """
+        schedules = {}
+        with ThreadPoolExecutor(max_workers=_SCHEDULE_WORKERS) as executor:
+            for schedule in executor.map(self.get_team_schedule, dates):
+                schedules.update(schedule)
+        return schedules
+    
     def filter_teams_by_gameday(self, players: List[Dict], teams: List[str]) -> List[Dict]:
         """
         Filter players to only include those from specified teams.
@@ -998,7 +1630,7 @@ class NHLDataFetcher:
         if not teams:
             return players
         
-        teams_upper = [t.upper() for t in teams]
+        teams_upper = frozenset(t.upper() for t in teams)
         filtered = [
             p for p in players 
             if p.get('team', '').upper() in teams_upper
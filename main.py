@@ -12,7 +12,6 @@ from typing import List, Dict, Optional
 from datetime import datetime
 from pathlib import Path
 import json
-import requests
 
 # Import our custom modules
 from data_fetch import NHLDataFetcher
@@ -179,6 +178,11 @@ class NHLFantasyApp:
             enhanced_players = []
             failed_count = 0
             
+            # All landing pages at once: cached ones from disk, the rest concurrently
+            landings = self.fetcher.fetch_player_landings(
+                [player['id'] for player in self.players if player.get('id')]
+            )
+            
             for i, player in enumerate(self.players):
                 player_id = player.get('id')
                 if player_id:
@@ -186,33 +190,13 @@ class NHLFantasyApp:
                         print(f"  Processing players {i+1}-{min(i+50, len(self.players))}/{len(self.players)}...")
                     
                     try:
-                        # Fetch the full player data with stats structure
-                        cache_file = os.path.join(self.fetcher.cache_dir, f"player_{player_id}.json")
-                        full_player_data = None
-                        
-                        # Try to load from cache first
-                        if os.path.exists(cache_file):
-                            try:
-                                with open(cache_file, 'r', encoding='utf-8') as f:
-                                    full_player_data = json.load(f)
-                            except:
-                                pass
-                        
-                        # If not in cache, fetch it
-                        if not full_player_data:
-                            try:
-                                url = f"{self.fetcher.base_url}/player/{player_id}/landing"
-                                response = requests.get(url, timeout=10)
-                                response.raise_for_status()
-                                full_player_data = response.json()
-                                # Cache it
-                                with open(cache_file, 'w', encoding='utf-8') as f:
-                                    json.dump(full_player_data, f, ensure_ascii=False, indent=2)
-                            except Exception as e:
-                                failed_count += 1
-                                if failed_count < 5:
-                                    print(f"  ⚠️  Could not fetch data for player {player_id}: {e}")
-                                continue
+                        # The full player data with stats structure
+                        full_player_data = landings.get(player_id)
+                        if isinstance(full_player_data, Exception):
+                            failed_count += 1
+                            if failed_count < 5:
+                                print(f"  ⚠️  Could not fetch data for player {player_id}: {full_player_data}")
+                            continue
                         
                         # Merge the full data structure into player object
                         # This preserves featuredStats, seasonTotals, etc.
@@ -5,6 +5,44 @@ Implements comprehensive scoring rules for NHL fantasy contests.
 
 from typing import Dict, Any, List, Union
 
+# Position labels (English and Czech/Slovak) mapped to F, D or G; anything else is a forward
+POSITION_MAP = {
+    **dict.fromkeys(['G', 'GOALIE', 'GOALKEEPER', 'B', 'BRANKÁR', 'BRANKAŘ'], 'G'),
+    **dict.fromkeys(['D', 'DEFENSE', 'DEFENDER', 'DEFENSEMAN', 'DEFENCEMAN', 'O', 'OBRANCA', 'OBRÁNCE'], 'D'),
+    **dict.fromkeys(['F', 'C', 'LW', 'RW', 'FORWARD', 'ATTACKER', 'CENTER', 'WING', 'Ú', 'ÚTOČNÍK', 'UTOČNÍK', 'L', 'R'], 'F'),
+}
+
+# Estimation rules read by both the per-player scorers (_calculate_*_points,
+# calculate_game_score) and the vectorized calculate_batch; change them here
+# so the two stay in sync
+
+# Estimated hat tricks per skater position: (minimum goals, goals per hat trick)
+HAT_TRICK_RULES = {
+    'F': (30, 10),
+    'D': (20, 15),
+}
+
+# Penalty minutes split into penalty types: (scoring key, share of PIM, minutes each);
+# mostly 2-min, some 5-min, rare misconducts
+PENALTY_SPLIT = (
+    ('penalty_2min', 0.8, 2),
+    ('penalty_5min', 0.15, 5),
+    ('misconduct_10min', 0.05, 10),
+)
+
+# GameScore as (stat keys, weight) pairs, summed and divided by games played
+GOALIE_GAME_SCORE_WEIGHTS = (
+    (('wins', 'w'), 0.5),
+    (('saves', 'sv'), 0.01),
+    (('goalsAgainst', 'ga'), -0.2),
+)
+SKATER_GAME_SCORE_WEIGHTS = (
+    (('goals', 'g'), 0.75),
+    (('assists', 'a'), 0.7),
+    (('shots', 's'), 0.05),
+    (('blockedShots', 'bs'), 0.05),
+)
+
 
 class FantasyScorer:
     """
@@ -377,8 +415,9 @@ class FantasyScorer:
         points += gwg * self.forward_scoring['game_winning_goal']
         
         # Hat tricks (estimate: 1 hat trick per 10 goals for high scorers)
-        if total_goals >= 30:
-            hat_tricks = max(1, int(total_goals / 10))
+        min_goals, goals_per_hat_trick = HAT_TRICK_RULES['F']
+        if total_goals >= min_goals:
+            hat_tricks = max(1, int(total_goals / goals_per_hat_trick))
             points += hat_tricks * self.forward_scoring['hat_trick']
         
         # Assists (estimate distribution like goals)
@@ -413,13 +452,8 @@ class FantasyScorer:
         # Penalties (negative points)
         pim = self._get_stat(stats, 'pim', 'penaltyMinutes')
         # Estimate distribution: mostly 2-min, some 5-min, rare misconducts
-        two_min_penalties = int(pim * 0.8 / 2)  # 80% are 2-min
-        five_min_penalties = int(pim * 0.15 / 5)  # 15% are 5-min
-        misconduct = int(pim * 0.05 / 10)  # 5% are misconducts
-        
-        points += two_min_penalties * self.common_scoring['penalty_2min']
-        points += five_min_penalties * self.common_scoring['penalty_5min']
-        points += misconduct * self.common_scoring['misconduct_10min']
+        for rule, share, minutes in PENALTY_SPLIT:
+            points += int(pim * share / minutes) * self.common_scoring[rule]
         
         return max(0, points)
     
@@ -443,8 +477,9 @@ class FantasyScorer:
         points += gwg * self.defense_scoring['game_winning_goal']
         
         # Hat tricks (rare for defenders)
-        if total_goals >= 20:
-            hat_tricks = max(1, int(total_goals / 15))
+        min_goals, goals_per_hat_trick = HAT_TRICK_RULES['D']
+        if total_goals >= min_goals:
+            hat_tricks = max(1, int(total_goals / goals_per_hat_trick))
             points += hat_tricks * self.defense_scoring['hat_trick']
         
         # Assists
@@ -478,13 +513,8 @@ class FantasyScorer:
         
         # Penalties
         pim = self._get_stat(stats, 'pim', 'penaltyMinutes')
-        two_min_penalties = int(pim * 0.8 / 2)
-        five_min_penalties = int(pim * 0.15 / 5)
-        misconduct = int(pim * 0.05 / 10)
-        
-        points += two_min_penalties * self.common_scoring['penalty_2min']
-        points += five_min_penalties * self.common_scoring['penalty_5min']
-        points += misconduct * self.common_scoring['misconduct_10min']
+        for rule, share, minutes in PENALTY_SPLIT:
+            points += int(pim * share / minutes) * self.common_scoring[rule]
         
         return max(0, points)
     
@@ -636,19 +666,7 @@ class FantasyScorer:
         """
         Normalize position to standard format: F (forward), D (defense), G (goalie).
         """
-        pos = position.upper().strip()
-        
-        if pos in ['G', 'GOALIE', 'GOALKEEPER', 'B', 'BRANKÁR', 'BRANKAŘ']:
-            return 'G'
-        
-        if pos in ['D', 'DEFENSE', 'DEFENDER', 'DEFENSEMAN', 'DEFENCEMAN', 'O', 'OBRANCA', 'OBRÁNCE']:
-            return 'D'
-        
-        # All forward positions map to 'F'
-        if pos in ['F', 'C', 'LW', 'RW', 'FORWARD', 'ATTACKER', 'CENTER', 'WING', 'Ú', 'ÚTOČNÍK', 'UTOČNÍK', 'L', 'R']:
-            return 'F'
-        
-        return 'F'  # Default
+        return POSITION_MAP.get(position.upper().strip(), 'F')
     
     def _get_stat(self, stats: Dict, *keys: str) -> Union[int, float]:
         """
@@ -674,23 +692,10 @@ class FantasyScorer:
         position = self._normalize_position(player.get('position', 'F'))
         games = max(1, self._get_stat(stats, 'gamesPlayed', 'games', 'gp'))
         
-        if position == 'G':
-            # Goalie GameScore
-            wins = self._get_stat(stats, 'wins', 'w')
-            saves = self._get_stat(stats, 'saves', 'sv')
-            ga = self._get_stat(stats, 'goalsAgainst', 'ga')
-            
-            gs = (wins * 0.5) + (saves * 0.01) - (ga * 0.2)
-            return gs / games
-        else:
-            # Skater GameScore
-            goals = self._get_stat(stats, 'goals', 'g')
-            assists = self._get_stat(stats, 'assists', 'a')
-            shots = self._get_stat(stats, 'shots', 's')
-            blocked = self._get_stat(stats, 'blockedShots', 'bs')
-            
-            gs = (goals * 0.75) + (assists * 0.7) + (shots * 0.05) + (blocked * 0.05)
-            return gs / games
+        # Goalie or skater GameScore
+        weights = GOALIE_GAME_SCORE_WEIGHTS if position == 'G' else SKATER_GAME_SCORE_WEIGHTS
+        gs = sum(self._get_stat(stats, *keys) * weight for keys, weight in weights)
+        return gs / games
     
     def calculate_fantasy_points_per_game(self, player: Dict[str, Any]) -> float:
         """Calculate fantasy points per game."""
@@ -703,6 +708,123 @@ class FantasyScorer:
         
         return total_points / games
 
+    def _stat_column(self, stats, *keys: str):
+        """
+        Vectorized counterpart of _get_stat for a DataFrame of stats.
+        Takes the first present, numeric value among keys for each row, 0 otherwise.
+        """
+        import numpy as np
+        import pandas as pd
+        
+        column = pd.Series(np.nan, index=stats.index, dtype=float)
+        for key in keys:
+            if key in stats:
+                column = column.fillna(pd.to_numeric(stats[key], errors='coerce'))
+        return column.fillna(0.0).to_numpy(dtype=float)
+    
+    def calculate_batch(self, stats, positions):
+        """
+        Calculate GameScore and fantasy points per game for many players at once.
+        Mirrors calculate_game_score and calculate_fantasy_points_per_game, but works
+        on whole stat columns instead of one player dictionary at a time.
+        
+        The two must stay in sync: both read the scoring dicts and the module-level
+        HAT_TRICK_RULES, PENALTY_SPLIT and *_GAME_SCORE_WEIGHTS, so a scoring change
+        belongs there; any change to the formulas themselves has to be made in both.
+        
+        Args:
+            stats: DataFrame of combined stats (one row per player, see _extract_combined_stats)
+            positions: Normalized positions (G/D/F) aligned with the rows of stats
+            
+        Returns:
+            DataFrame with games, gs_per_game and fp_per_game columns, indexed like stats
+        """
+        import numpy as np
+        import pandas as pd
+        
+        stat = lambda *keys: self._stat_column(stats, *keys)
+        positions = np.asarray(positions)
+        
+        games = stat('games', 'gamesPlayed', 'games_played')
+        per_game = np.maximum(1.0, stat('gamesPlayed', 'games', 'gp'))
+        
+        # Shared skater/goalie inputs
+        goals = stat('goals', 'g')
+        pp_goals = stat('powerPlayGoals', 'ppg')
+        sh_goals = stat('shorthandedGoals', 'shg')
+        even_goals = np.maximum(0, goals - pp_goals - sh_goals)
+        assists = stat('assists', 'a')
+        pp_assists = np.maximum(0, stat('powerPlayPoints', 'ppp') - pp_goals)
+        sh_assists = np.maximum(0, stat('shorthandedPoints', 'shp') - sh_goals)
+        even_assists = np.maximum(0, assists - pp_assists - sh_assists)
+        gwg = stat('gameWinningGoals', 'gwg')
+        shots = stat('shots', 'sog', 's')
+        hits = stat('hits', 'h')
+        blocked = stat('blockedShots', 'blocked', 'bs')
+        plus_minus = stat('plusMinus', 'plus_minus_rating', 'plusminus')
+        pim = stat('pim', 'penaltyMinutes')
+        
+        penalty_points = sum(
+            np.trunc(pim * share / minutes) * self.common_scoring[rule]
+            for rule, share, minutes in PENALTY_SPLIT
+        )
+        
+        def skater_points(rules, hat_trick_goals, goals_per_hat_trick):
+            points = (
+                even_goals * rules['goal_even'] +
+                pp_goals * rules['goal_pp'] +
+                sh_goals * rules['goal_sh'] +
+                gwg * rules['game_winning_goal'] +
+                even_assists * rules['assist_even'] +
+                pp_assists * rules['assist_pp'] +
+                sh_assists * rules['assist_sh'] +
+                shots * self.common_scoring['shot'] +
+                hits * self.common_scoring['hit'] +
+                blocked * rules['blocked_shot'] +
+                plus_minus * self.common_scoring['plus_minus'] +
+                penalty_points
+            )
+            hat_tricks = np.where(
+                goals >= hat_trick_goals,
+                np.maximum(1, np.trunc(goals / goals_per_hat_trick)),
+                0
+            )
+            return np.maximum(0, points + hat_tricks * rules['hat_trick'])
+        
+        forward_points = skater_points(self.forward_scoring, *HAT_TRICK_RULES['F'])
+        defender_points = skater_points(self.defense_scoring, *HAT_TRICK_RULES['D'])
+        
+        # Goalie points
+        wins = stat('wins', 'w')
+        goals_against = stat('goalsAgainst', 'ga')
+        saves = stat('saves', 'sv', 'savesTotal')
+        saves = np.where(saves == 0, np.maximum(0, stat('shotsAgainst', 'sa') - goals_against), saves)
+        rules = self.goalie_scoring
+        goalie_points = (
+            wins * rules['win'] +
+            stat('losses', 'l') * rules['loss'] +
+            stat('shutouts', 'so') * rules['shutout'] +
+            saves * rules['save'] +
+            goals_against * rules['goal_against'] +
+            np.where(goals > 0, even_goals * rules['goal_even'] + pp_goals * rules['goal_pp'] + sh_goals * rules['goal_sh'], 0) +
+            np.where(assists > 0, even_assists * rules['assist_even'] + pp_assists * rules['assist_pp'] + sh_assists * rules['assist_sh'], 0)
+        )
+        goalie_points = np.maximum(0, goalie_points)
+        
+        is_goalie = positions == 'G'
+        points = np.select([is_goalie, positions == 'D'], [goalie_points, defender_points], forward_points)
+        
+        # GameScore
+        goalie_gs = sum(stat(*keys) * weight for keys, weight in GOALIE_GAME_SCORE_WEIGHTS)
+        skater_gs = sum(stat(*keys) * weight for keys, weight in SKATER_GAME_SCORE_WEIGHTS)
+        game_score = np.where(is_goalie, goalie_gs, skater_gs)
+        
+        return pd.DataFrame({
+            'games': games,
+            'gs_per_game': game_score / per_game,
+            'fp_per_game': points / per_game
+        }, index=stats.index)
+
     def generate_scoring_breakdown(self, player: Dict[str, Any]) -> str:
         """
         Generate a detailed breakdown of how fantasy points were calculated for a player.
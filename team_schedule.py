@@ -42,16 +42,16 @@ def main():
     # Check schedule for specified days
     print(f"NHL Schedule for the next {args.days} day(s):\n")
     
-    for day_offset in range(args.days):
-        check_date = start_date + timedelta(days=day_offset)
-        date_str = check_date.strftime('%Y-%m-%d')
-        
+    dates = [(start_date + timedelta(days=day_offset)).strftime('%Y-%m-%d')
+             for day_offset in range(args.days)]
+    # Fetch every day's schedule up front, concurrently
+    schedules = fetcher.get_team_schedules(dates)
+    
+    for date_str in dates:
         print(f"Date: {format_date(date_str)}")
         print("-" * 60)
         
-        # Get schedule for this date
-        schedule = fetcher.get_team_schedule(date_str)
-        teams_playing = schedule.get(date_str, [])
+        teams_playing = schedules.get(date_str, [])
         
         # Filter by team if specified
         if args.team:
@@ -5,14 +5,23 @@ This script helps diagnose data issues by analyzing player data and price files.
 
 import json
 import csv
+import itertools
 import os
 import sys
 from typing import Dict, List, Any, Optional
 import difflib
 
+try:
+    import orjson  # Optional, much faster JSON parsing
+except ImportError:
+    orjson = None
+
 def load_json_file(filepath: str) -> Any:
     """Load any JSON file"""
     try:
+        if orjson is not None:
+            with open(filepath, 'rb') as f:
+                return orjson.loads(f.read())
         with open(filepath, 'r', encoding='utf-8') as f:
             return json.load(f)
     except Exception as e:
@@ -106,27 +115,20 @@ def analyze_price_file(filepath: str) -> None:
             with open(filepath, 'r', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 
-                # Check for header
+                # Check for header; a data row goes back in front of the rest
                 first_row = next(reader, None)
+                rows = reader
                 if first_row and any(h.lower() in ['hráč', 'player', 'name'] for h in first_row):
                     print(f"Header detected: {first_row}")
-                else:
-                    # Process as data row
-                    name = first_row[0] if first_row else None
-                    if name and len(first_row) >= 3:
-                        price = float(f"{first_row[1]}.{first_row[2]}")
-                        prices[name] = price
+                elif first_row is not None:
+                    rows = itertools.chain([first_row], reader)
                 
-                # Process remaining rows
-                for row in reader:
-                    if row and len(row) >= 3:
-                        name = row[0]
-                        price = float(f"{row[1]}.{row[2]}")
-                        prices[name] = price
+                # "Name,30,9" -> 30.9
+                prices = {row[0]: float(f"{row[1]}.{row[2]}") for row in rows if len(row) >= 3}
             
             print(f"Found {len(prices)} prices in CSV format")
             print("Sample prices:")
-            for name, price in list(prices.items())[:5]:
+            for name, price in itertools.islice(prices.items(), 5):
                 print(f"  {name}: {price}M")
         except Exception as e:
             print(f"Error parsing CSV: {e}")
@@ -141,7 +143,7 @@ def analyze_price_file(filepath: str) -> None:
         elif isinstance(data, dict):
             print(f"Found {len(data)} entries in JSON dict format")
             print("Sample entries:")
-            for k, v in list(data.items())[:5]:
+            for k, v in itertools.islice(data.items(), 5):
                 print(f"  {k}: {v}")
 
 def main():
@@ -3,7 +3,6 @@ from data_fetch import NHLDataFetcher
 from scoring import FantasyScorer
 import json
 import os
-import requests
 
 # Fetch data
 fetcher = NHLDataFetcher()
@@ -35,7 +34,8 @@ for i, player in enumerate(players):
             if not full_player_data:
                 try:
                     url = f"{fetcher.base_url}/player/{player_id}/landing"
-                    response = requests.get(url, timeout=10)
+                    # Fetcher's pooled session: one keep-alive connection for every player
+                    response = fetcher.session.get(url, timeout=10)
                     response.raise_for_status()
                     full_player_data = response.json()
                     # Cache it
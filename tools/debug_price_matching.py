@@ -12,45 +12,61 @@ import difflib
 import unicodedata
 import re
 
+try:
+    from rapidfuzz import fuzz, process as rf_process  # Optional, C++ fuzzy matching
+except ImportError:
+    rf_process = None
+
+# Compiled once instead of on every normalize_name call
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def _strip_diacritics(text: str) -> str:
+    """NFKD, then drop the combining marks."""
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in text if not unicodedata.combining(ch))
+
+# Accented Latin letters straight to their lowercase ASCII base (č -> c), built
+# from the NFKD path itself so both give the same result
+_FOLD = {}
+for _cp in range(0x80, 0x250):
+    _folded = _strip_diacritics(chr(_cp)).lower()
+    if _folded and _folded.isascii():
+        _FOLD[_cp] = _folded
+
 def normalize_name(name: str) -> str:
     """Return a normalized name for comparison."""
     if not name:
         return ''
-    # Normalize unicode, remove diacritics
-    name = unicodedata.normalize('NFKD', name)
-    name = ''.join(ch for ch in name if not unicodedata.combining(ch))
-    # Lowercase, remove special chars, keep alphanumerics and spaces
-    name = name.lower().replace('.', ' ').replace(',', ' ')
-    name = re.sub(r'[^a-z0-9\s]', '', name)
-    name = re.sub(r'\s+', ' ', name).strip()
+    # Remove diacritics: the table covers Latin names, NFKD only runs for the rest
+    name = name.lower().translate(_FOLD)
+    if not name.isascii():
+        name = _strip_diacritics(name).lower()
+    # Remove special chars, keep alphanumerics and spaces
+    name = name.replace('.', ' ').replace(',', ' ')
+    name = _NON_ALNUM_RE.sub('', name)
+    name = _WHITESPACE_RE.sub(' ', name).strip()
     return name
 
 def generate_name_variants(name: str) -> List[str]:
-    """Generate multiple variants of a player name."""
-    variants = set()
-    
-    # Original name
-    variants.add(name.lower())
-    
-    # Normalize
+    """Generate multiple variants of a player name, most specific first."""
+    # Original name, then its normalized form
     norm_name = normalize_name(name)
-    if norm_name and norm_name != name.lower():
-        variants.add(norm_name)
+    variants = [name.lower(), norm_name]
     
     # Split into tokens
-    tokens = norm_name.split() if norm_name else []
+    tokens = norm_name.split()
     
     if len(tokens) >= 2:
-        # Last name + first initial
-        variants.add(f"{tokens[-1]} {tokens[0][0]}")
-        
-        # Last name only
-        variants.add(tokens[-1])
-        
-        # Last name + first initial with period
-        variants.add(f"{tokens[-1]} {tokens[0][0]}.")
+        last, first_initial = tokens[-1], tokens[0][0]
+        variants += [
+            f"{last} {first_initial}.",  # Last name + first initial with period
+            f"{last} {first_initial}",   # Last name + first initial
+            last,                        # Last name only
+        ]
     
-    return list(filter(None, variants))
+    # Each form once, in the order above, without empty strings
+    return [v for v in dict.fromkeys(variants) if v]
 
 def load_price_data(filepath: str) -> List[Dict]:
     """Load price data from a JSON file."""
@@ -153,12 +169,18 @@ def analyze_price_matching(players: List[Dict], prices: List[Dict], output_file:
         if not match_found:
             best_match = None
             best_ratio = 0.0
+            norm_player = normalize_name(player_name)
             
-            for price_name in norm_prices.keys():
-                ratio = difflib.SequenceMatcher(None, normalize_name(player_name), price_name).ratio()
-                if ratio > best_ratio:
-                    best_ratio = ratio
-                    best_match = price_name
+            if rf_process is not None:
+                result = rf_process.extractOne(norm_player, norm_prices.keys(), scorer=fuzz.ratio)
+                if result is not None:
+                    best_match, best_ratio = result[0], result[1] / 100.0
+            else:
+                for price_name in norm_prices.keys():
+                    ratio = difflib.SequenceMatcher(None, norm_player, price_name).ratio()
+                    if ratio > best_ratio:
+                        best_ratio = ratio
+                        best_match = price_name
             
             if best_match and best_ratio > 0.8:
                 match_found = True